@@ -0,0 +1,184 @@
+"""
+Import time benchmarks for misc_utils and its submodules.
+
+Each module is imported in fresh interpreters with `python -X importtime`,
+keeping the fastest of several runs. The report shows each module's total
+import time, and the time spent importing the heavy dependencies.
+
+Run from the repository root:
+
+    python benchmarks/bench_importtime.py --update   # record the baseline
+    python benchmarks/bench_importtime.py            # compare against it
+
+Exits with status 1 when a module's total import time regresses past the
+threshold, relative to the baseline. Compare runs made with the same
+bytecode caching, with PYTHONDONTWRITEBYTECODE set every import compiles.
+"""
+import argparse
+import json
+from pathlib import Path
+import subprocess
+import sys
+
+ROOT = Path(__file__).parent.parent
+BASELINE = Path(__file__).parent / "importtime_baseline.json"
+
+MODULES = (
+    "misc_utils",
+    "misc_utils.datetime_utils",
+    "misc_utils.decorator_utils",
+    "misc_utils.iterable_utils",
+    "misc_utils.media_utils",
+    "misc_utils.misc_utils",
+    "misc_utils.networking_utils",
+    "misc_utils.param_utils",
+    "misc_utils.string_utils",
+    "misc_utils.timing_utils",
+)
+DEPENDENCIES = ("dateparser", "pendulum", "cv2", "numpy", "PIL")
+
+# Regressions smaller than this are noise, in microseconds
+MIN_REGRESSION_US = 5_000
+
+
+def parse_importtime(stderr: str) -> dict:
+    """
+    Map each imported module to its `(self, cumulative)` import time in microseconds.
+
+    >>> parse_importtime("import time:       250 |        250 |     copyreg")
+    {'copyreg': (250, 250)}
+    """
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if self_us.strip().isdigit():  # Skips the header
+            times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def measure(module: str, runs: int) -> dict:
+    """
+    Import `module` in `runs` fresh interpreters, keeping each imported
+    module's fastest self and cumulative times, each from any run.
+    Raises ImportError if the module can't be imported.
+    """
+    best = {}
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            raise ImportError(result.stderr.strip().splitlines()[-1])
+
+        for name, times in parse_importtime(result.stderr).items():
+            best[name] = tuple(map(min, best.get(name, times), times))
+    return best
+
+
+def summarize(module: str, times: dict) -> dict:
+    """
+    The module's total import time, and for each dependency it imports, the
+    self time of the dependency's modules summed, and its total import time.
+    """
+    dependencies = {}
+    for dependency in DEPENDENCIES:
+        if dependency not in times:
+            continue
+        dependencies[dependency] = {
+            "self_us": sum(
+                self_us
+                for name, (self_us, _) in times.items()
+                if name == dependency or name.startswith(f"{dependency}.")
+            ),
+            "total_us": times[dependency][1],
+        }
+    return {"total_us": times[module][1], "dependencies": dependencies}
+
+
+def bench_importtime(runs: int = 5) -> dict:
+    results = {}
+    for module in MODULES:
+        try:
+            results[module] = summarize(module, measure(module, runs))
+        except ImportError as e:
+            results[module] = {"error": str(e)}
+    return results
+
+
+def report(results: dict, baseline: dict) -> None:
+    print(f"{'module':<32}{'total (ms)':>12}{'baseline (ms)':>15}  dependencies (self / total ms)")
+    for module, result in results.items():
+        if "error" in result:
+            print(f"{module:<32}{'-':>12}{'-':>15}  {result['error']}")
+            continue
+
+        base = baseline.get(module, {}).get("total_us")
+        dependencies = ", ".join(
+            f"{name} {times['self_us'] / 1000:.1f} / {times['total_us'] / 1000:.1f}"
+            for name, times in result["dependencies"].items()
+        )
+        print(
+            f"{module:<32}{result['total_us'] / 1000:>12.1f}"
+            f"{'-' if base is None else f'{base / 1000:.1f}':>15}  {dependencies}"
+        )
+
+
+def regressions(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    The modules whose total import time grew by more than `threshold`
+    (a fraction of the baseline) and by more than MIN_REGRESSION_US.
+    """
+    regressed = []
+    for module, result in results.items():
+        base = baseline.get(module, {}).get("total_us")
+        if base is None or "error" in result:
+            continue
+
+        growth = result["total_us"] - base
+        if growth > MIN_REGRESSION_US and growth > base * threshold:
+            regressed.append(module)
+    return regressed
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="interpreters per module")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="allowed growth over the baseline, as a fraction (default 0.25)",
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument(
+        "--update", action="store_true", help="record the results as the baseline"
+    )
+    args = parser.parse_args(argv)
+
+    results = bench_importtime(args.runs)
+
+    if args.update:
+        args.baseline.write_text(json.dumps(results, indent=4) + "\n")
+        report(results, results)
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    report(results, baseline)
+    if not baseline:
+        print(f"\nNo baseline at {args.baseline}, record one with --update")
+        return 0
+
+    regressed = regressions(results, baseline, args.threshold)
+    for module in regressed:
+        print(f"\n{module} regressed past the {args.threshold:.0%} threshold")
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+"""
+Benchmarks for misc_utils.param_utils.
+
+Run from the repository root:
+
+    python benchmarks/bench_param_utils.py
+"""
+from pathlib import Path
+import sys
+import timeit
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from misc_utils import ArgMutator
+
+
+def three_args(a, b, c=3):
+    ...
+
+
+def many_params(pos_only, /, pos_or_kw, *args, kw_only, kw_default=None, **kwargs):
+    ...
+
+
+CASES = {
+    "three_args(1, 2)": (three_args, (1, 2), {}),
+    "three_args(1, b=2, c=4)": (three_args, (1,), {"b": 2, "c": 4}),
+    "many_params(...)": (many_params, (1, 2, 3, 4), {"kw_only": 5, "extra": 6}),
+}
+
+
+def time_call(func, args, kwargs, number):
+    return min(
+        timeit.repeat(lambda: ArgMutator.bind(func, *args, **kwargs), number=number, repeat=5)
+    ) / number
+
+
+def bench_bind(number: int = 20_000) -> None:
+    print(f"{'case':<28}{'inspect (us)':>14}{'compiled (us)':>15}{'speedup':>10}")
+    for name, (func, args, kwargs) in CASES.items():
+        ArgMutator.compiled_bind = False
+        inspect_time = time_call(func, args, kwargs, number)
+
+        ArgMutator.compiled_bind = True
+        compiled_time = time_call(func, args, kwargs, number)
+
+        print(
+            f"{name:<28}{inspect_time * 1e6:>14.2f}{compiled_time * 1e6:>15.2f}"
+            f"{inspect_time / compiled_time:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    bench_bind()
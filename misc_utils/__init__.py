@@ -1,24 +1,106 @@
+"""
+The package's names are resolved lazily (PEP 562), so `import misc_utils`
+doesn't import every submodule and its dependencies (dateparser, pendulum, ...).
+A submodule is imported the first time one of its names, or the submodule
+itself, is used.
+"""
 
-try:
-    from .decorator_utils import export
-    from .decorator_utils import *
-
-    from .datetime_utils import *
-    from .iterable_utils import *
-    # from .media_utils import *
-    from .misc_utils import *
-    from .networking_utils import *
-    from .param_utils import *
-    from .string_utils import *
-except ImportError:
-    from decorator_utils import export
-    from decorator_utils import *
-
-    from datetime_utils import *
-    from iterable_utils import *
-    # from media_utils import *
-    from misc_utils import *
-    from networking_utils import *
-    from param_utils import *
-    from string_utils import *
+import importlib
 
+# Submodules star-imported by the package
+# media_utils is left out, as its functions aren't tested just yet
+_MODULES = (
+    "decorator_utils",
+    "datetime_utils",
+    "iterable_utils",
+    "misc_utils",
+    "networking_utils",
+    "param_utils",
+    "string_utils",
+    "timing_utils",
+)
+
+# The names each submodule exports with `@export`, test_init checks these
+# against the submodules' `__all__`
+_EXPORTS = {
+    "decorator_utils": (
+        "export",
+        "selfie",
+        "validate_annotations",
+        "memoize",
+        "disk_memoize",
+        "single_flight",
+        "micro_batch",
+        "parallel_map",
+        "apply_decorators",
+    ),
+    "datetime_utils": ("DateTimeUtils", "StopWatch"),
+    "iterable_utils": (
+        "arg_to_iter",
+        "chunk_iter",
+        "flatten",
+        "iflatten",
+        "all_indicies",
+        "iter_indices",
+        "AhoCorasick",
+        "sort_list_by_key",
+        "sort_list_by_attr",
+    ),
+    "misc_utils": (
+        "json_dump",
+        "json_load",
+        "rmdir_non_empty",
+        "reprint",
+        "ordinal",
+        "search_file",
+    ),
+    "networking_utils": ("find_open_port",),
+    "param_utils": (
+        "Param",
+        "SignatureCache",
+        "ParamProbe",
+        "ArgMutator",
+        "bind_args",
+        "missing_args",
+        "missing_args_many",
+        "build_signature",
+        "mapping_to_kwargs",
+        "RecordLoader",
+    ),
+    "string_utils": ("normalize_space", "normalize_newlines", "CaseConverter"),
+    "timing_utils": (
+        "LatencyHistogram",
+        "get_histogram",
+        "dump_histograms",
+        "reset_histograms",
+        "timed",
+    ),
+}
+
+# name -> submodule
+_exported_names = {name: module for module, names in _EXPORTS.items() for name in names}
+
+
+def _import(module: str):
+    if __package__:
+        return importlib.import_module(f".{module}", __package__)
+    return importlib.import_module(module)
+
+
+def __getattr__(name: str):
+    if name == "__all__":
+        return list(_exported_names)
+
+    if name in _MODULES:
+        value = _import(name)
+    elif name in _exported_names:
+        value = getattr(_import(_exported_names[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value  # Only resolved once
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()).union(_exported_names, _MODULES))
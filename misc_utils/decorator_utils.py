@@ -1,6 +1,16 @@
+import atexit
+import collections
+import collections.abc
 import inspect
 import functools
-from typing import Any, Callable
+import itertools
+import operator
+import os
+import threading
+import time
+import types
+import typing
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
 import sys
 
 
@@ -77,6 +87,18 @@ def selfie(*ignore_parameters: str) -> Callable:
         ignore_parameters = tuple()
 
     def decorator(func: Callable) -> Callable:
+        assign = _compile_selfie_assigner(func, ignore_parameters)
+
+        if assign is not None:
+
+            @functools.wraps(func)
+            def wrapper(self, *args, **kwargs):
+                assign(self, *args, **kwargs)
+                return func(self, *args, **kwargs)
+
+            return wrapper
+
+        # Signatures that can't be compiled fall back to binding on each call
         @functools.wraps(func)
         def wrapper(self, *args, **kwargs):
             # lazily import ArgMutator to avoid circular imports
@@ -95,15 +117,1634 @@ def selfie(*ignore_parameters: str) -> Callable:
 
         return wrapper
 
+    decorator.__fuse__ = lambda func: _selfie_hook(ignore_parameters)
+    return decorator if used_parenthesis else decorator(func)
+
+
+# `apply_decorators(func, selfie, fuse=True)`
+selfie.__fuse__ = lambda func: _selfie_hook(())
+
+
+def _selfie_hook(ignore_parameters: Tuple[str, ...]) -> Callable:
+    """
+    `selfie` for `apply_decorators(..., fuse=True)`, assigning the arguments
+    of the shared ArgMutator.
+    """
+
+    def assign(mutator) -> None:
+        for name, value in mutator.asdict().items():
+            if name not in ignore_parameters:
+                setattr(mutator.instance, name, value)
+
+    return assign
+
+
+def _compile_selfie_assigner(
+    func: Callable, ignore_parameters: Tuple[str, ...]
+) -> Optional[Callable]:
+    """
+    Generate the assignment routine used by `selfie`, once per decorated method.
+
+    The routine takes the same parameters as `func`, so the interpreter binds
+    the arguments, and only assigns the parameters that aren't ignored.
+
+    For `@selfie("b")` on `def __init__(self, a, b=2, *args): ...` it generates
+
+        def __init__(self, a, b=2, *args):
+            self.a = a
+            self.args = args
+
+    It's named after `func`, so invalid calls raise the `TypeError` the
+    method would. Plain attribute assignment goes through the class's
+    descriptors, so `__slots__` are written directly. Returns None if the
+    signature can't be compiled.
+    """
+    # lazily import to avoid circular imports
+    try:
+        from .param_utils import (
+            VAR_POSITIONAL,
+            ParamProbe,
+            _compile_function,
+            _source_parameters,
+        )
+    except ImportError:
+        from param_utils import (
+            VAR_POSITIONAL,
+            ParamProbe,
+            _compile_function,
+            _source_parameters,
+        )
+
+    try:
+        self_param, *parameters = (
+            inspect.Parameter(p.name, p.built_in_kind, default=p.default)
+            for p in ParamProbe(func)
+        )
+    except (TypeError, ValueError):  # No signature, or no `self` parameter
+        return None
+
+    if self_param.kind is VAR_POSITIONAL:
+        return None
+
+    namespace = {}
+    source_params = _source_parameters((self_param, *parameters), namespace)
+    if source_params is None:
+        return None
+
+    body = [
+        f"    {self_param.name}.{param.name} = {param.name}"
+        for param in parameters
+        if param.name not in ignore_parameters
+    ]
+    return _compile_function(
+        source_params, body or ["    pass"], func.__qualname__, namespace
+    )
+
+
+@export
+def validate_annotations(
+    func: Optional[Callable] = None, *, sample_every: int = 1
+) -> Callable:
+    """
+    Check the arguments of each call against the function's annotations.
+
+    The checkers are compiled once, on the first validated call, so calls
+    don't inspect the signature or the annotations. Supported annotations
+    include classes, `None`, `Any`, `Optional`, `Union` (and `X | Y`),
+    `Literal`, `Annotated`, `Type[X]`, `Callable`, and `list[int]`,
+    `tuple[int, ...]`, `dict[str, int]` and similar; anything else isn't checked.
+
+    Args:
+    ----
+        func (Callable): The function to decorate, when used as `@validate_annotations`.
+        sample_every (int): Only validate every Nth call. Defaults to 1.
+
+    Returns:
+    -------
+        Callable: A decorator function, or the decorated function.
+
+    Raises:
+    ------
+        TypeError: When an argument doesn't match its annotation.
+
+    Example:
+    -------
+    @validate_annotations(sample_every=100)
+    def scale(values: list[float], factor: Optional[float] = None): ...
+
+    # Global kill switch
+    validate_annotations.enabled = False
+    """
+    if sample_every < 1:
+        raise ValueError(f"sample_every must be at least 1, not {sample_every}.")
+
+    def decorator(func: Callable) -> Callable:
+        validate = None
+        calls = itertools.count()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            nonlocal validate
+
+            if validate_annotations.enabled and next(calls) % sample_every == 0:
+                if validate is None:
+                    validate = _compile_validator(func)
+                validate(*args, **kwargs)
+
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    decorator.__fuse__ = lambda func: _validate_annotations_hook(func, sample_every)
+    return decorator if func is None else decorator(func)
+
+
+# Global kill switch for `validate_annotations`
+validate_annotations.enabled = True
+
+# `apply_decorators(func, validate_annotations, fuse=True)`
+validate_annotations.__fuse__ = lambda func: _validate_annotations_hook(func, 1)
+
+
+def _validate_annotations_hook(func: Callable, sample_every: int) -> Callable:
+    """
+    `validate_annotations` for `apply_decorators(..., fuse=True)`, checking
+    the arguments of the shared ArgMutator.
+    """
+    check_arguments = None
+    calls = itertools.count()
+
+    def validate(mutator) -> None:
+        nonlocal check_arguments
+
+        if validate_annotations.enabled and next(calls) % sample_every == 0:
+            if check_arguments is None:
+                check_arguments = _compile_argument_checker(func)
+            check_arguments(mutator.asdict())
+
+    return validate
+
+
+def _compile_validator(func: Callable) -> Callable[..., None]:
+    """
+    Compile a function which binds a call's arguments and checks them
+    against the annotations of `func`, raising TypeError on a mismatch.
+    """
+    # lazily import to avoid circular imports
+    try:
+        from .param_utils import ArgMutator, ParamProbe
+    except ImportError:
+        from param_utils import ArgMutator, ParamProbe
+
+    # The binder has the full parameter list, `self` included
+    bind = ArgMutator._build_binder(ParamProbe(func))
+    check_arguments = _compile_argument_checker(func)
+
+    def validate(*args, **kwargs) -> None:
+        check_arguments(bind(*args, **kwargs))
+
+    return validate
+
+
+def _compile_argument_checker(func: Callable) -> Callable[[Dict[str, Any]], None]:
+    """
+    Compile a function which checks bound arguments, by parameter name,
+    against the annotations of `func`. Missing arguments aren't checked.
+    """
+    # lazily import to avoid circular imports
+    try:
+        from .param_utils import ParamProbe
+    except ImportError:
+        from param_utils import ParamProbe
+
+    # Resolves string annotations, e.g. `from __future__ import annotations`
+    try:
+        hints = typing.get_type_hints(func, include_extras=True)
+    except Exception:
+        hints = None  # Resolved per parameter, so only the bad one is skipped
+
+    checks = []
+    for param in ParamProbe(func):
+        if hints is not None:
+            annotation = hints.get(param.name, param.annotation)
+        else:
+            annotation = _resolve_annotation(func, param.annotation)
+        check = _compile_checker(annotation)
+        if check is None:
+            continue
+
+        if param.is_var_pos:
+            check = _all_checker(check)
+        elif param.is_var_kw:
+            check = _values_checker(check)
+        checks.append((param.name, check, annotation))
+
+    func_name = getattr(func, "__qualname__", repr(func))
+
+    def check_arguments(arguments: Dict[str, Any]) -> None:
+        for name, check, annotation in checks:
+            value = arguments.get(name, _MISSING)
+            if value is not _MISSING and not check(value):
+                raise TypeError(
+                    f"{func_name}() argument `{name}` must be "
+                    f"{_describe_annotation(annotation)}, not {value!r}."
+                )
+
+    return check_arguments
+
+
+def _resolve_annotation(func: Callable, annotation: Any) -> Any:
+    """
+    Evaluate a string annotation in the namespace of `func`, leaving it
+    unchecked (empty) if it can't be, e.g. `"str | None"` before Python 3.10.
+    """
+    if not isinstance(annotation, str):
+        return annotation
+
+    func = inspect.unwrap(getattr(func, "__func__", func))
+    try:
+        annotation = eval(annotation, getattr(func, "__globals__", {}))
+    except Exception:
+        return inspect.Parameter.empty
+    return type(None) if annotation is None else annotation
+
+
+def _compile_checker(annotation: Any) -> Optional[Callable[[Any], bool]]:
+    """
+    Return a predicate for values matching `annotation`, or None if any value
+    matches, or the annotation isn't supported.
+    """
+    if annotation in (inspect.Parameter.empty, Any, object):
+        return None
+    if annotation is None or annotation is type(None):
+        return lambda value: value is None
+    if annotation is float:  # PEP 484 numeric tower
+        return lambda value: isinstance(value, (float, int))
+    if annotation is complex:
+        return lambda value: isinstance(value, (complex, float, int))
+    if hasattr(annotation, "__supertype__"):  # typing.NewType
+        return _compile_checker(annotation.__supertype__)
+    if isinstance(annotation, type) and not typing.get_args(annotation):
+        return lambda value: isinstance(value, annotation)
+
+    origin, args = typing.get_origin(annotation), typing.get_args(annotation)
+
+    if origin is typing.Annotated:
+        return _compile_checker(args[0])
+
+    if origin is typing.Union or (
+        _UnionType is not None and isinstance(annotation, _UnionType)
+    ):
+        checks = [_compile_checker(arg) for arg in args]
+        if any(check is None for check in checks):
+            return None
+        return lambda value: any(check(value) for check in checks)
+
+    if origin is typing.Literal:
+        return lambda value: any(
+            type(value) is type(arg) and value == arg for arg in args
+        )
+
+    if origin is type:
+        if not args or not isinstance(args[0], type):
+            return lambda value: isinstance(value, type)
+        return lambda value: isinstance(value, type) and issubclass(value, args[0])
+
+    if origin is collections.abc.Callable:
+        return callable
+
+    if origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis:
+            return _container_checker(tuple, _compile_checker(args[0]))
+        if args == ((),):  # tuple[()]
+            return lambda value: value == ()
+
+        checks = [_compile_checker(arg) for arg in args]
+        return lambda value: (
+            isinstance(value, tuple)
+            and len(value) == len(checks)
+            and all(check is None or check(v) for check, v in zip(checks, value))
+        )
+
+    if origin in (dict, collections.abc.Mapping, collections.abc.MutableMapping):
+        key_check, value_check = (
+            (_compile_checker(args[0]), _compile_checker(args[1]))
+            if args
+            else (None, None)
+        )
+        return lambda value: (
+            isinstance(value, origin)
+            and (key_check is None or all(key_check(k) for k in value.keys()))
+            and (value_check is None or all(value_check(v) for v in value.values()))
+        )
+
+    if origin in _ELEMENT_CHECKED_CONTAINERS:
+        return _container_checker(origin, _compile_checker(args[0]) if args else None)
+
+    # Other generics, e.g. `Iterable[int]`, only have their origin checked,
+    # checking elements could consume an iterator.
+    if isinstance(origin, type):
+        return lambda value: isinstance(value, origin)
+
+    return None
+
+
+# `int | str`, Python 3.10+
+_UnionType = getattr(types, "UnionType", None)
+
+_ELEMENT_CHECKED_CONTAINERS = (
+    list,
+    set,
+    frozenset,
+    collections.deque,
+    collections.abc.Sequence,
+    collections.abc.MutableSequence,
+    collections.abc.Set,
+    collections.abc.MutableSet,
+)
+
+
+def _container_checker(
+    container: type, element_check: Optional[Callable[[Any], bool]]
+) -> Callable[[Any], bool]:
+    if element_check is None:
+        return lambda value: isinstance(value, container)
+    return lambda value: isinstance(value, container) and all(
+        element_check(element) for element in value
+    )
+
+
+def _all_checker(check: Callable[[Any], bool]) -> Callable[[Any], bool]:
+    """Checks each argument passed to `*args`."""
+    return lambda values: all(check(value) for value in values)
+
+
+def _values_checker(check: Callable[[Any], bool]) -> Callable[[Any], bool]:
+    """Checks each argument passed to `**kwargs`."""
+    return lambda values: all(check(value) for value in values.values())
+
+
+def _describe_annotation(annotation: Any) -> str:
+    if isinstance(annotation, type) and not typing.get_args(annotation):
+        return annotation.__name__
+    return str(annotation).replace("typing.", "")
+
+
+@export
+def memoize(
+    *ignore_parameters: str,
+    policy: str = "lru",
+    maxsize: Optional[int] = 128,
+    max_bytes: Optional[int] = None,
+    ttl: Optional[float] = None,
+    sizeof: Optional[Callable[[Any], int]] = None,
+) -> Callable:
+    """
+    Cache a function's results, keyed by its normalized arguments.
+
+    Unlike `functools.lru_cache`, `f(1, b=2)`, `f(1, 2)` and `f(1)` (where
+    b defaults to 2) share one cache entry, as every call is bound to the
+    function's signature, with defaults applied and `**kwargs` sorted.
+    Calls with unhashable arguments aren't cached.
+
+    Args:
+    ----
+        *ignore_parameters (str): Names of the parameters left out of the key.
+        policy (str): The eviction policy, "lru", "lfu" or "ttl". Defaults to "lru".
+        maxsize (int): The maximum number of entries, None for no limit. Defaults to 128.
+        max_bytes (int): The maximum total size of cached results, None for
+            no limit. Defaults to None.
+        ttl (float): Seconds before an entry expires, required by the "ttl"
+            policy. Defaults to None.
+        sizeof (Callable): Measures a result's size in bytes for `max_bytes`.
+            Defaults to the deep size of the result, including the objects
+            it contains.
+
+    Returns:
+    -------
+        Callable: A decorator function, or the decorated function.
+        The decorated function has `cache_info()` and `cache_clear()` methods.
+
+    Example:
+    -------
+    @memoize("session", policy="lfu", maxsize=1024)
+    def fetch(url, timeout=10, session=None): ...
+
+    fetch("a", 10) is fetch("a") is fetch(url="a", timeout=10)
+    """
+    # Determine if the usage is @memoize or @memoize()
+    used_parenthesis: bool = not (
+        len(ignore_parameters) == 1 and callable(ignore_parameters[0])
+    )
+
+    if used_parenthesis is False:
+        func = ignore_parameters[0]
+        ignore_parameters = tuple()
+
+    if policy not in _MemoCache.POLICIES:
+        raise ValueError(
+            f"policy must be one of {_MemoCache.POLICIES}, not {policy!r}."
+        )
+    if policy == "ttl" and ttl is None:
+        raise ValueError("The 'ttl' policy requires a ttl.")
+    if maxsize is not None and maxsize < 1:
+        raise ValueError(f"maxsize must be at least 1, not {maxsize}.")
+
+    def decorator(func: Callable) -> Callable:
+        make_key = _compile_key_maker(func, ignore_parameters)
+        cache = _MemoCache(policy, maxsize, max_bytes, ttl, sizeof)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                key = make_key(*args, **kwargs)
+                value = cache.get(key)
+            except TypeError:
+                # Unhashable arguments, or arguments func can't accept
+                return func(*args, **kwargs)
+
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                cache.put(key, value)
+            return value
+
+        wrapper.cache_info = cache.info
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator if used_parenthesis else decorator(func)
+
+
+_MISSING = object()
+
+
+def _compile_key_maker(
+    func: Callable, ignore_parameters: Tuple[str, ...] = ()
+) -> Callable[..., tuple]:
+    """
+    Build a function turning a call to `func` into a canonical key, the
+    bound argument values in parameter order, with defaults applied and
+    `**kwargs` sorted by name. Raises TypeError for arguments that don't bind.
+    """
+    # lazily import to avoid circular imports
+    try:
+        from .param_utils import ArgMutator, ParamProbe
+    except ImportError:
+        from param_utils import ArgMutator, ParamProbe
+
+    param_probe = ParamProbe(func)
+
+    unknown = set(ignore_parameters).difference(param_probe.names)
+    if unknown:
+        raise ValueError(
+            f"{param_probe.func_name}() has no parameters named {sorted(unknown)}."
+        )
+
+    bind = ArgMutator._build_binder(param_probe)
+    names = [
+        param.name
+        for param in param_probe
+        if param.name not in ignore_parameters and not param.is_var_kw
+    ]
+    var_kw = next(
+        (
+            param.name
+            for param in param_probe
+            if param.is_var_kw and param.name not in ignore_parameters
+        ),
+        None,
+    )
+
+    if len(names) > 1:
+        values = operator.itemgetter(*names)
+    else:
+        # itemgetter returns a lone value, rather than a tuple, for one name
+        def values(arguments: Dict[str, Any]) -> tuple:
+            return tuple(arguments[name] for name in names)
+
+    if var_kw is None:
+
+        def make_key(*args, **kwargs) -> tuple:
+            return values(bind(*args, **kwargs))
+
+        return make_key
+
+    def make_key(*args, **kwargs) -> tuple:
+        arguments = bind(*args, **kwargs)
+        return (*values(arguments), tuple(sorted(arguments[var_kw].items())))
+
+    return make_key
+
+
+def _deep_sizeof(value: Any) -> int:
+    """
+    The `sys.getsizeof` of the value and every object it holds, counting
+    shared objects once. Classes, modules and functions aren't followed.
+
+    >>> _deep_sizeof(["x" * 1000]) > 1000
+    True
+    """
+    seen, stack, total = set(), [value], 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+
+        if isinstance(obj, _ATOMIC_TYPES):
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset, collections.deque)):
+            stack.extend(obj)
+        else:
+            stack.extend(getattr(obj, "__dict__", {}).values())
+            slots = getattr(type(obj), "__slots__", ())
+            for name in (slots,) if isinstance(slots, str) else slots:
+                stack.append(getattr(obj, name, None))
+    return total
+
+
+# Objects `_deep_sizeof` doesn't look inside
+_ATOMIC_TYPES = (
+    str,
+    bytes,
+    bytearray,
+    int,
+    float,
+    complex,
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+)
+
+
+class _MemoCache:
+    """
+    The store behind `memoize`. Entries are `[value, nbytes, expires, uses]`;
+    the "lru" and "ttl" policies evict from the front of the ordered entries,
+    "lfu" evicts the oldest entry of the least used bucket.
+    """
+
+    POLICIES = ("lru", "lfu", "ttl")
+
+    def __init__(
+        self,
+        policy: str,
+        maxsize: Optional[int],
+        max_bytes: Optional[int],
+        ttl: Optional[float],
+        sizeof: Optional[Callable[[Any], int]] = None,
+    ):
+        self.policy = policy
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.sizeof = sizeof or _deep_sizeof
+        self.lock = threading.RLock()
+        self.clear()
+
+    def get(self, key: Any) -> Any:
+        with self.lock:
+            entry = self.entries.get(key)
+
+            if (
+                entry is not None
+                and entry[2] is not None
+                and entry[2] <= time.monotonic()
+            ):
+                self._remove(key)
+                self.evictions += 1
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return _MISSING
+
+            self.hits += 1
+            if self.policy == "lru":
+                self.entries.move_to_end(key)
+            elif self.policy == "lfu":
+                self._use(key, entry)
+            return entry[0]
+
+    def put(self, key: Any, value: Any) -> None:
+        nbytes = self.sizeof(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            return
+
+        with self.lock:
+            # Another thread may have computed the same value meanwhile
+            if key in self.entries:
+                self._remove(key)
+
+            while self.entries and (
+                (self.maxsize is not None and len(self.entries) >= self.maxsize)
+                or (self.max_bytes is not None and self.bytes + nbytes > self.max_bytes)
+            ):
+                self._evict()
+
+            expires = None if self.ttl is None else time.monotonic() + self.ttl
+            self.entries[key] = [value, nbytes, expires, 1]
+            self.bytes += nbytes
+            if self.policy == "lfu":
+                self.uses[1][key] = None
+                self.least_uses = 1
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries = collections.OrderedDict()
+            self.uses = collections.defaultdict(collections.OrderedDict)
+            self.least_uses = 0
+            self.bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def info(self) -> Dict[str, int]:
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self.entries),
+                "bytes": self.bytes,
+            }
+
+    # ... Private Methods ...
+    def _use(self, key: Any, entry: list) -> None:
+        uses = entry[3]
+        bucket = self.uses[uses]
+        del bucket[key]
+        if not bucket:
+            del self.uses[uses]
+            if self.least_uses == uses:
+                self.least_uses = uses + 1
+
+        entry[3] = uses + 1
+        self.uses[uses + 1][key] = None
+
+    def _evict(self) -> None:
+        if self.policy == "lfu":
+            if self.least_uses not in self.uses:
+                self.least_uses = min(self.uses)
+            key = next(iter(self.uses[self.least_uses]))
+        else:
+            key = next(iter(self.entries))
+
+        self._remove(key)
+        self.evictions += 1
+
+    def _remove(self, key: Any) -> None:
+        entry = self.entries.pop(key)
+        self.bytes -= entry[1]
+
+        if self.policy == "lfu":
+            bucket = self.uses[entry[3]]
+            del bucket[key]
+            if not bucket:
+                del self.uses[entry[3]]
+
+
+@export
+def disk_memoize(
+    *ignore_parameters: str,
+    path: Optional[str] = None,
+    version: str = "",
+    max_bytes: Optional[int] = 2**30,
+    compress: bool = False,
+) -> Callable:
+    """
+    Cache a function's results in a sqlite database, so they outlive the process.
+
+    Entries are keyed like `memoize`, by the normalized arguments, together
+    with the function's qualified name and `version`; change the version
+    when the function's results change. The least recently used entries
+    are evicted once the stored results exceed `max_bytes`. The database
+    can be shared by threads and processes.
+
+    Arguments and results must be picklable, calls with arguments that
+    aren't are not cached. Arguments should also pickle the same way in
+    every process, e.g. sets of strings don't, as string hashes are randomized.
+
+    Args:
+    ----
+        *ignore_parameters (str): Names of the parameters left out of the key.
+        path (str): The database file. Defaults to `~/.cache/misc_utils/disk_memoize.sqlite3`.
+        version (str): Part of every key, to invalidate old results. Defaults to "".
+        max_bytes (int): The budget for the stored results, None for no limit. Defaults to 1GiB.
+        compress (bool): zlib compress the stored results. Defaults to False.
+
+    Returns:
+    -------
+        Callable: A decorator function, or the decorated function.
+        The decorated function has `cache_info()` and `cache_clear()` methods.
+
+    Example:
+    -------
+    @disk_memoize(version="2", compress=True)
+    def extract_features(image_path, size=256): ...
+    """
+    # Determine if the usage is @disk_memoize or @disk_memoize()
+    used_parenthesis: bool = not (
+        len(ignore_parameters) == 1 and callable(ignore_parameters[0])
+    )
+
+    if used_parenthesis is False:
+        func = ignore_parameters[0]
+        ignore_parameters = tuple()
+
+    if path is None:
+        path = os.path.join(
+            os.path.expanduser("~"), ".cache", "misc_utils", "disk_memoize.sqlite3"
+        )
+
+    def decorator(func: Callable) -> Callable:
+        import hashlib
+        import pickle
+        import zlib
+
+        make_key = _compile_key_maker(func, ignore_parameters)
+        name = f"{func.__module__}.{func.__qualname__}"
+        store = _DiskStore(path, max_bytes)
+        stats = dict.fromkeys(("hits", "misses"), 0)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                key = pickle.dumps(
+                    (name, version, make_key(*args, **kwargs)), protocol=4
+                )
+            except Exception:
+                # Unpicklable arguments, or arguments func can't accept
+                return func(*args, **kwargs)
+
+            digest = hashlib.sha256(key).digest()
+            row = store.get(digest)
+            if row is not None:
+                stats["hits"] += 1
+                value, compressed = row
+                return pickle.loads(zlib.decompress(value) if compressed else value)
+
+            stats["misses"] += 1
+            result = func(*args, **kwargs)
+
+            try:
+                value = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception:
+                return result  # Unpicklable results aren't stored
+            if compress:
+                value = zlib.compress(value)
+            store.put(digest, name, value, compress)
+            return result
+
+        def cache_info() -> Dict[str, int]:
+            return {**stats, "evictions": store.evictions, **store.info(name)}
+
+        def cache_clear() -> None:
+            store.clear(name)
+            stats.update(dict.fromkeys(stats, 0))
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator if used_parenthesis else decorator(func)
+
+
+class _DiskStore:
+    """
+    The sqlite database behind `disk_memoize`. Each thread of each process
+    has its own connection, the database is in WAL mode so readers don't
+    block writers. `meta` holds the total size of the stored values, which
+    is updated in the same transaction as the entries.
+
+    Hits only write the entry's access time once it's `ACCESS_INTERVAL`
+    seconds old, so most reads don't wait on the write lock. Eviction is
+    least recently used to within the interval.
+    """
+
+    ACCESS_INTERVAL = 60
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS entries ("
+        " key BLOB PRIMARY KEY, func TEXT NOT NULL, value BLOB NOT NULL,"
+        " compressed INTEGER NOT NULL, size INTEGER NOT NULL, accessed REAL NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)",
+        "CREATE INDEX IF NOT EXISTS entries_func ON entries (func)",
+        "CREATE TABLE IF NOT EXISTS meta (id INTEGER PRIMARY KEY CHECK (id = 0),"
+        " total INTEGER NOT NULL)",
+        "INSERT OR IGNORE INTO meta VALUES (0, 0)",
+    )
+
+    def __init__(self, path: str, max_bytes: Optional[int]):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._local = threading.local()
+
+    def get(self, key: bytes) -> Optional[Tuple[bytes, bool]]:
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT value, compressed, accessed FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        value, compressed, accessed = row
+        now = time.time()
+        if now - accessed >= self.ACCESS_INTERVAL:
+            with connection:
+                connection.execute(
+                    "UPDATE entries SET accessed = ? WHERE key = ?", (now, key)
+                )
+        return value, compressed
+
+    def put(self, key: bytes, func: str, value: bytes, compressed: bool) -> None:
+        size = len(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        connection = self._connection()
+        with connection:
+            # Takes the write lock now, so the total stays consistent
+            connection.execute("BEGIN IMMEDIATE")
+            old = connection.execute(
+                "SELECT size FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                (key, func, value, int(compressed), size, time.time()),
+            )
+            total = self._add_to_total(connection, size - (old[0] if old else 0))
+
+            if self.max_bytes is not None and total > self.max_bytes:
+                self._evict(connection, total - self.max_bytes)
+
+    def clear(self, func: str) -> None:
+        connection = self._connection()
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            (size,) = connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM entries WHERE func = ?", (func,)
+            ).fetchone()
+            connection.execute("DELETE FROM entries WHERE func = ?", (func,))
+            self._add_to_total(connection, -size)
+
+    def info(self, func: str) -> Dict[str, int]:
+        size, nbytes = (
+            self._connection()
+            .execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries WHERE func = ?",
+                (func,),
+            )
+            .fetchone()
+        )
+        return {"size": size, "bytes": nbytes}
+
+    # ... Private Methods ...
+    def _connection(self) -> Any:
+        import sqlite3
+
+        # Connections can't be shared with forked processes
+        connection, pid = getattr(self._local, "connection", (None, None))
+        if connection is not None and pid == os.getpid():
+            return connection
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            for statement in self.SCHEMA:
+                connection.execute(statement)
+
+        self._local.connection = (connection, os.getpid())
+        return connection
+
+    @staticmethod
+    def _add_to_total(connection: Any, size: int) -> int:
+        connection.execute("UPDATE meta SET total = total + ? WHERE id = 0", (size,))
+        return connection.execute("SELECT total FROM meta WHERE id = 0").fetchone()[0]
+
+    def _evict(self, connection: Any, excess: int) -> None:
+        """Delete the least recently used entries, until `excess` bytes are freed."""
+        keys, freed = [], 0
+        for key, size in connection.execute(
+            "SELECT key, size FROM entries ORDER BY accessed"
+        ):
+            keys.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+
+        connection.executemany("DELETE FROM entries WHERE key = ?", keys)
+        self._add_to_total(connection, -freed)
+        self.evictions += len(keys)
+
+
+@export
+def single_flight(
+    *ignore_parameters: str,
+    ttl: Optional[float] = None,
+    maxsize: Optional[int] = 128,
+) -> Callable:
+    """
+    Share one in-flight call of a coroutine function between every caller
+    awaiting it with the same arguments, keyed like `memoize`.
+
+    A caller that is cancelled stops waiting, without cancelling the call
+    for the other callers; the call itself is only cancelled once every
+    caller has been. With a `ttl`, results (not exceptions) are also cached.
+
+    Args:
+    ----
+        *ignore_parameters (str): Names of the parameters left out of the key.
+        ttl (float): Seconds to cache results for, None to not cache them. Defaults to None.
+        maxsize (int): The maximum number of cached results. Defaults to 128.
+
+    Returns:
+    -------
+        Callable: A decorator function, or the decorated function.
+        The decorated function has `flight_info()` and `cache_clear()` methods.
+
+    Raises:
+    ------
+        TypeError: When the decorated function isn't a coroutine function.
+
+    Example:
+    -------
+    @single_flight(ttl=30)
+    async def fetch(url, timeout=10): ...
+
+    # One request is made
+    await asyncio.gather(fetch("a"), fetch("a", 10), fetch(url="a"))
+    """
+    # Determine if the usage is @single_flight or @single_flight()
+    used_parenthesis: bool = not (
+        len(ignore_parameters) == 1 and callable(ignore_parameters[0])
+    )
+
+    if used_parenthesis is False:
+        func = ignore_parameters[0]
+        ignore_parameters = tuple()
+
+    def decorator(func: Callable) -> Callable:
+        import asyncio
+
+        if not inspect.iscoroutinefunction(func):
+            raise TypeError(f"{func.__qualname__} is not a coroutine function.")
+
+        make_key = _compile_key_maker(func, ignore_parameters)
+        cache = None if ttl is None else _MemoCache("ttl", maxsize, None, ttl)
+        flights = {}  # (loop, key) -> [task, waiters]
+        stats = dict.fromkeys(("leaders", "coalesced", "hits", "cancelled"), 0)
+
+        def land(flight_key, flight, task):
+            if flights.get(flight_key) is flight:
+                del flights[flight_key]
+
+            # Retrieving the exception also stops asyncio logging it
+            if not task.cancelled() and task.exception() is None:
+                if cache is not None:
+                    cache.put(flight_key[1], task.result())
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                key = make_key(*args, **kwargs)
+                flight_key = (asyncio.get_running_loop(), key)
+                flight = flights.get(flight_key)
+            except TypeError:
+                # Unhashable arguments, or arguments func can't accept
+                return await func(*args, **kwargs)
+
+            if flight is None and cache is not None:
+                value = cache.get(key)
+                if value is not _MISSING:
+                    stats["hits"] += 1
+                    return value
+
+            if flight is None:
+                stats["leaders"] += 1
+                task = flight_key[0].create_task(func(*args, **kwargs))
+                flight = flights[flight_key] = [task, 0]
+                task.add_done_callback(functools.partial(land, flight_key, flight))
+            else:
+                stats["coalesced"] += 1
+
+            task = flight[0]
+            flight[1] += 1
+            try:
+                return await asyncio.shield(task)
+            except asyncio.CancelledError:
+                if task.cancelled():
+                    raise
+
+                # Only this caller was cancelled
+                stats["cancelled"] += 1
+                flight[1] -= 1
+                if flight[1] == 0 and not task.done():
+                    if flights.get(flight_key) is flight:
+                        del flights[flight_key]
+                    task.cancel()
+                raise
+
+        def flight_info() -> Dict[str, int]:
+            return {**stats, "in_flight": len(flights)}
+
+        def cache_clear() -> None:
+            if cache is not None:
+                cache.clear()
+            stats.update(dict.fromkeys(stats, 0))
+
+        wrapper.flight_info = flight_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator if used_parenthesis else decorator(func)
+
+
+@export
+def micro_batch(
+    *batched: str, max_batch_size: int = 64, max_wait: float = 0.005
+) -> Callable:
+    """
+    Turn a bulk function into a per-item function, which collects the items
+    of calls made close together and passes them to the bulk function at once.
+
+    The bulk function takes a list for its batched parameter (the first
+    parameter, unless named) and returns the results in the same order.
+    Calls are batched together when their other arguments are equal.
+    A batch is dispatched once it holds `max_batch_size` items, or when
+    `max_wait` seconds have passed since its first item. Each caller
+    blocks (or awaits, if the bulk function is a coroutine function)
+    until its own result is ready.
+
+    Args:
+    ----
+        *batched (str): The name of the batched parameter, optional.
+        max_batch_size (int): The most items in a batch. Defaults to 64.
+        max_wait (float): The longest a batch waits for more items, in seconds. Defaults to 0.005.
+
+    Returns:
+    -------
+        Callable: A decorator function, or the decorated function.
+        The decorated function has a `batch_info()` method, reporting the
+        count of each batch size, and a `LatencyHistogram` summary of the
+        items' latencies, from the call to the result, in nanoseconds.
+
+    Example:
+    -------
+    @micro_batch("keys", max_batch_size=100)
+    def get(keys, table="users"):
+        return database.get_many(table, keys)
+
+    # Called from many threads, the rows are fetched in batches
+    row = get(42)
+    """
+    # Determine if the usage is @micro_batch or @micro_batch()
+    used_parenthesis: bool = not (len(batched) == 1 and callable(batched[0]))
+
+    if used_parenthesis is False:
+        func = batched[0]
+        batched = tuple()
+
+    if len(batched) > 1:
+        raise TypeError("micro_batch takes one batched parameter name.")
+    if max_batch_size < 1:
+        raise ValueError(f"max_batch_size must be at least 1, not {max_batch_size}.")
+
+    def decorator(func: Callable) -> Callable:
+        batcher = _Batcher(
+            func, batched[0] if batched else None, max_batch_size, max_wait
+        )
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                return await batcher.submit_async(args, kwargs)
+
+        else:
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                return batcher.submit(args, kwargs)
+
+        wrapper.batch_info = batcher.info
+        return wrapper
+
+    return decorator if used_parenthesis else decorator(func)
+
+
+class _Batcher:
+    """
+    The pending batches of a `micro_batch` function, keyed by the call's
+    other arguments. Threaded callers share `lock`; coroutine callers
+    batch per event loop.
+
+    A threaded batch that doesn't fill up is dispatched by its first
+    caller, once it's waited `max_wait` for the batch's results, so no
+    threads are started and slow batches don't hold up the others.
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        batched: Optional[str],
+        max_batch_size: int,
+        max_wait: float,
+    ):
+        # lazily import to avoid circular imports
+        try:
+            from .param_utils import ParamProbe
+            from .timing_utils import LatencyHistogram
+        except ImportError:
+            from param_utils import ParamProbe
+            from timing_utils import LatencyHistogram
+
+        param_probe = ParamProbe(func)
+        if batched is None:
+            batched = next(
+                (p.name for p in param_probe if p.name not in ("self", "cls")), None
+            )
+        if batched not in param_probe.names:
+            raise ValueError(
+                f"{param_probe.func_name}() has no parameter named {batched!r}."
+            )
+
+        param = next(p for p in param_probe if p.name == batched)
+        if param.is_var_pos or param.is_var_kw:
+            raise ValueError(f"The batched parameter can't be `{param.kind}`.")
+
+        self.func = func
+        self.batched = batched
+        self.default = param.default
+        # Where the item is when it's passed positionally
+        self.position = (
+            [p.name for p in param_probe if p.can_pass_pos_arg].index(batched)
+            if param.can_pass_pos_arg
+            else None
+        )
+        self.make_key = _compile_key_maker(func, (batched,))
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+
+        self.lock = threading.Lock()
+        self.pending = {}  # key -> _Batch
+        self.tasks = set()  # Dispatching async batches, referenced until they finish
+        self.batch_sizes = collections.Counter()
+        self.latencies = LatencyHistogram(f"{func.__qualname__}.latency")
+
+    def submit(self, args: tuple, kwargs: dict) -> Any:
+        import concurrent.futures
+
+        future = concurrent.futures.Future()
+        key, item = self._key_and_item(args, kwargs)
+
+        full = None
+        with self.lock:
+            try:
+                batch = self.pending.get(key)
+            except TypeError:  # Unhashable arguments get a batch of their own
+                key, batch = object(), None
+
+            leader = batch is None
+            if leader:
+                batch = self.pending[key] = _Batch(args, kwargs)
+
+            batch.add(item, future)
+            if len(batch.items) >= self.max_batch_size:
+                del self.pending[key]
+                full = batch
+
+        if full is not None:
+            self._dispatch(full)
+        elif leader:
+            # The first caller dispatches the batch if it hasn't filled up in time
+            concurrent.futures.wait((future,), self.max_wait)
+            with self.lock:
+                expired = self.pending.get(key) is batch
+                if expired:
+                    del self.pending[key]
+            if expired:
+                self._dispatch(batch)
+        return future.result()
+
+    async def submit_async(self, args: tuple, kwargs: dict) -> Any:
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        key, item = self._key_and_item(args, kwargs)
+
+        try:
+            batch = self.pending.get((loop, key))
+            key = (loop, key)
+        except TypeError:  # Unhashable arguments get a batch of their own
+            key, batch = (loop, object()), None
+
+        if batch is None:
+            batch = self.pending[key] = _Batch(args, kwargs)
+            batch.timer = loop.call_later(self.max_wait, self._flush_async, key, batch)
+
+        batch.add(item, future)
+        if len(batch.items) >= self.max_batch_size:
+            del self.pending[key]
+            batch.timer.cancel()
+            self._start_task(loop, self._dispatch_async(batch))
+
+        return await future
+
+    def info(self) -> Dict[str, Any]:
+        with self.lock:
+            batch_sizes = dict(sorted(self.batch_sizes.items()))
+        latency = self.latencies.summary()
+        return {
+            "batches": sum(batch_sizes.values()),
+            "items": latency["count"],
+            "batch_sizes": batch_sizes,
+            "latency_ns": latency,
+        }
+
+    # ... Private Methods ...
+    def _key_and_item(self, args: tuple, kwargs: dict) -> Tuple[Any, Any]:
+        # Raises TypeError, as calling the function would, for invalid arguments
+        key = self.make_key(*args, **kwargs)
+
+        if self.batched in kwargs:
+            item = kwargs[self.batched]
+        elif self.position is not None and self.position < len(args):
+            item = args[self.position]
+        else:
+            item = self.default
+        return key, item
+
+    def _bulk_arguments(self, batch: "_Batch") -> Tuple[tuple, dict]:
+        args, kwargs = batch.args, batch.kwargs
+        if self.position is not None and self.position < len(args):
+            args = (*args[: self.position], batch.items, *args[self.position + 1 :])
+        else:
+            kwargs = {**kwargs, self.batched: batch.items}
+        return args, kwargs
+
+    def _flush_async(self, key: Any, batch: "_Batch") -> None:
+        import asyncio
+
+        if self.pending.get(key) is batch:
+            del self.pending[key]
+            self._start_task(asyncio.get_running_loop(), self._dispatch_async(batch))
+
+    def _start_task(self, loop: Any, coroutine: Any) -> None:
+        # The loop only keeps weak references to tasks
+        task = loop.create_task(coroutine)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    def _dispatch(self, batch: "_Batch") -> None:
+        args, kwargs = self._bulk_arguments(batch)
+        try:
+            results = self._check_results(batch, self.func(*args, **kwargs))
+        except BaseException as e:
+            for future in batch.futures:
+                future.set_exception(e)
+        else:
+            for future, result in zip(batch.futures, results):
+                future.set_result(result)
+        self._record(batch)
+
+    async def _dispatch_async(self, batch: "_Batch") -> None:
+        args, kwargs = self._bulk_arguments(batch)
+        try:
+            results = self._check_results(batch, await self.func(*args, **kwargs))
+        except BaseException as e:
+            for future in batch.futures:
+                if not future.done():  # Cancelled callers
+                    future.set_exception(e)
+        else:
+            for future, result in zip(batch.futures, results):
+                if not future.done():
+                    future.set_result(result)
+        self._record(batch)
+
+    def _check_results(self, batch: "_Batch", results: Iterable[Any]) -> list:
+        results = list(results)
+        if len(results) != len(batch.items):
+            raise ValueError(
+                f"{self.func.__qualname__} returned {len(results)} results "
+                f"for {len(batch.items)} items."
+            )
+        return results
+
+    def _record(self, batch: "_Batch") -> None:
+        now = time.perf_counter_ns()
+        with self.lock:
+            self.batch_sizes[len(batch.items)] += 1
+        for started in batch.started:
+            self.latencies.record(now - started)
+
+
+class _Batch:
+    __slots__ = ("args", "kwargs", "items", "futures", "started", "timer")
+
+    def __init__(self, args: tuple, kwargs: dict):
+        # The first call's arguments, the batched argument is replaced by the items
+        self.args = args
+        self.kwargs = kwargs
+        self.items = []
+        self.futures = []
+        self.started = []
+        self.timer = None
+
+    def add(self, item: Any, future: Any) -> None:
+        self.items.append(item)
+        self.futures.append(future)
+        self.started.append(time.perf_counter_ns())
+
+
+@export
+def parallel_map(
+    *iterable: str,
+    executor: str = "process",
+    max_workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    threshold: int = 100,
+    merge: Optional[Callable[[Iterable[Any]], Any]] = None,
+) -> Callable:
+    """
+    Split the items passed to a function across a pool of workers, calling
+    the function once per chunk of items and merging the results in order.
+
+    The items are the function's `*args` parameter, unless the name of a
+    parameter taking a sequence is given. Each call returns a result per
+    item, which are concatenated into a list unless `merge` is given.
+    Calls made inside a worker, and calls with fewer than `threshold`
+    items, run serially. The pools are shared between decorated functions
+    and reused across calls; with the "process" executor, the function
+    must be importable from its module.
+
+    Args:
+    ----
+        *iterable (str): The name of the parameter to split, optional.
+        executor (str): Either "process" or "thread". Defaults to "process".
+        max_workers (int): The pool's worker count. Defaults to the executor's default.
+        chunk_size (int): Items per chunk. Defaults to spreading the items
+            across four chunks per worker.
+        threshold (int): The fewest items to split across the pool. Defaults to 100.
+        merge (Callable): Combines the chunks' results. Defaults to concatenating them.
+
+    Returns:
+    -------
+        Callable: A decorator function, or the decorated function.
+
+    Example:
+    -------
+    @parallel_map(chunk_size=500)
+    def checksums(*paths, algorithm="sha256"):
+        return [hash_file(path, algorithm) for path in paths]
+
+    checksums(*all_paths)
+    """
+    # Determine if the usage is @parallel_map or @parallel_map()
+    used_parenthesis: bool = not (len(iterable) == 1 and callable(iterable[0]))
+
+    if used_parenthesis is False:
+        func = iterable[0]
+        iterable = tuple()
+
+    if len(iterable) > 1:
+        raise TypeError("parallel_map takes one parameter name.")
+    if executor not in _EXECUTOR_TYPES:
+        raise ValueError(
+            f"executor must be one of {tuple(_EXECUTOR_TYPES)}, not {executor!r}."
+        )
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, not {chunk_size}.")
+
+    def decorator(func: Callable) -> Callable:
+        split = _compile_splitter(func, iterable[0] if iterable else None)
+        merge_results = merge or (lambda results: list(itertools.chain(*results)))
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # Calls made by the workers
+            if getattr(_worker_state, "serial", False):
+                return func(*args, **kwargs)
+
+            items, join_chunk = split(args, kwargs)
+            if len(items) < max(threshold, 2):
+                args, kwargs = join_chunk(items)
+                return merge_results([func(*args, **kwargs)])
+
+            pool, workers = _shared_executor(executor, max_workers)
+            size = chunk_size or -(-len(items) // (workers * 4))
+            calls = [
+                join_chunk(items[start : start + size])
+                for start in range(0, len(items), size)
+            ]
+
+            # The wrapper is pickled by reference, and runs serially in the workers
+            return merge_results(
+                pool.map(_call_serially, itertools.repeat(wrapper), calls)
+            )
+
+        return wrapper
+
     return decorator if used_parenthesis else decorator(func)
 
 
+_worker_state = threading.local()
+
+# Executors shared by `parallel_map` functions, keyed by type and worker count
+_EXECUTOR_TYPES = {"process": "ProcessPoolExecutor", "thread": "ThreadPoolExecutor"}
+_executors = {}  # (kind, max_workers) -> (pool, worker count)
+_executors_lock = threading.Lock()
+
+
+def _shared_executor(kind: str, max_workers: Optional[int]) -> Tuple[Any, int]:
+    """
+    The shared pool of `kind`, and its worker count. The defaults match
+    the executors' own.
+    """
+    import concurrent.futures
+
+    with _executors_lock:
+        entry = _executors.get((kind, max_workers))
+        if entry is None:
+            workers = max_workers
+            if workers is None:
+                cpus = os.cpu_count() or 1
+                workers = cpus if kind == "process" else min(32, cpus + 4)
+
+            pool_type = getattr(concurrent.futures, _EXECUTOR_TYPES[kind])
+            entry = _executors[(kind, max_workers)] = (pool_type(workers), workers)
+            if len(_executors) == 1:
+                atexit.register(_shutdown_executors)
+        return entry
+
+
+def _shutdown_executors() -> None:
+    # Before interpreter teardown, when the pools' own cleanup can fail
+    with _executors_lock:
+        pools = [pool for pool, _ in _executors.values()]
+        _executors.clear()
+    for pool in pools:
+        pool.shutdown()
+
+
+def _call_serially(func: Callable, call: Tuple[tuple, dict]) -> Any:
+    previous = getattr(_worker_state, "serial", False)
+    _worker_state.serial = True
+    try:
+        return func(*call[0], **call[1])
+    finally:
+        _worker_state.serial = previous
+
+
+def _compile_splitter(func: Callable, name: Optional[str]) -> Callable:
+    """
+    Build `split(args, kwargs) -> (items, join_chunk)` for `parallel_map`,
+    where `join_chunk(chunk)` gives the `(args, kwargs)` of a call on `chunk`.
+    """
+    # lazily import to avoid circular imports
+    try:
+        from .param_utils import ParamProbe
+    except ImportError:
+        from param_utils import ParamProbe
+
+    param_probe = ParamProbe(func)
+    positional = [p.name for p in param_probe if p.can_pass_pos_arg]
+
+    if name is None:
+        var_pos = param_probe.get("VAR_POSITIONAL")
+        if var_pos is None:
+            raise ValueError(
+                f"{param_probe.func_name}() has no *args parameter, "
+                "name the parameter to split."
+            )
+
+        # Positional arguments past the named parameters are the items
+        leading = positional.index(var_pos.name)
+
+        def split(args: tuple, kwargs: dict) -> Tuple[Any, Callable]:
+            def join_chunk(chunk: tuple) -> Tuple[tuple, dict]:
+                return (*args[:leading], *chunk), kwargs
+
+            return args[leading:], join_chunk
+
+        return split
+
+    if name not in param_probe.names:
+        raise ValueError(f"{param_probe.func_name}() has no parameter named {name!r}.")
+    position = positional.index(name) if name in positional else None
+
+    def split(args: tuple, kwargs: dict) -> Tuple[Any, Callable]:
+        if position is not None and position < len(args):
+            items = args[position]
+
+            def join_chunk(chunk: Any) -> Tuple[tuple, dict]:
+                return (*args[:position], chunk, *args[position + 1 :]), kwargs
+
+        else:
+            items = kwargs.get(name, ())
+
+            def join_chunk(chunk: Any) -> Tuple[tuple, dict]:
+                return args, {**kwargs, name: chunk}
+
+        # Sequences are sliced, other iterables are materialized
+        if not isinstance(items, collections.abc.Sequence):
+            items = list(items)
+        return items, join_chunk
+
+    return split
+
+
 # noqa
 @export
-def apply_decorators(func, *decorators):
+def apply_decorators(func, *decorators, fuse: bool = False):
     """
     Apply any number of decorators to a function
+
+    With `fuse=True`, decorators which have a `__fuse__` method (`selfie`
+    and `validate_annotations`) share one wrapper, which binds each call's
+    arguments once, to an ArgMutator. `decorator.__fuse__(func)` returns a
+    hook called with the ArgMutator, in the order the decorators are listed,
+    before the function is called with the mutator's arguments.
+    Other decorators are applied as usual, between the fused runs.
+
+    Example:
+    -------
+    class Point:
+        def __init__(self, x: int, y: int):
+            ...
+
+        __init__ = apply_decorators(
+            __init__, validate_annotations, selfie, fuse=True
+        )
     """
+    if not fuse:
+        for decorator in reversed(decorators):
+            func = decorator(func)
+        return func
+
+    hooks = []  # The current run of fusable decorators, outermost first
     for decorator in reversed(decorators):
-        func = decorator(func)
-    return func
+        fuser = getattr(decorator, "__fuse__", None)
+        if fuser is not None:
+            hooks.insert(0, fuser(func))
+            continue
+
+        func = decorator(_fuse_hooks(func, hooks))
+        hooks = []
+    return _fuse_hooks(func, hooks)
+
+
+def _fuse_hooks(func: Callable, hooks: list) -> Callable:
+    if not hooks:
+        return func
+
+    # lazily import to avoid circular imports
+    try:
+        from .param_utils import ArgMutator, ParamProbe
+    except ImportError:
+        from param_utils import ArgMutator, ParamProbe
+
+    # The probe and binder are resolved once, rather than per call.
+    # Methods are bound to `self`, so the mutator holds the instance.
+    is_method = _defined_in_class(func)
+    param_probe = ParamProbe(func, remove_self=is_method)
+    bind = ArgMutator._build_binder(param_probe)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if is_method and args:
+            instance, args = args[0], args[1:]
+            target = types.MethodType(func, instance)
+        else:
+            instance, target = None, func
+
+        mutator = ArgMutator._prebound(
+            param_probe, instance, target, args, kwargs, bind(*args, **kwargs)
+        )
+        for hook in hooks:
+            hook(mutator)
+        return mutator.call()
+
+    return wrapper
+
+
+def _defined_in_class(func: Callable) -> bool:
+    """
+    Whether `func` is a function defined in a class body, and so takes `self`.
+    Nested functions have a dotted qualname too, `outer.<locals>.func`.
+    """
+    if inspect.ismethod(func):
+        return False
+    qualname = getattr(func, "__qualname__", "").split(".")
+    return len(qualname) > 1 and qualname[-2] != "<locals>"
@@ -1,5 +1,10 @@
+from collections import deque
+from collections.abc import Mapping
+from itertools import islice
+import mmap
 from operator import itemgetter
-from typing import Iterable, List, Tuple, Union, Any, Dict
+import sys
+from typing import Iterable, Iterator, List, Optional, Tuple, Union, Any, Dict
 
 try:
     from .decorator_utils import export
@@ -11,7 +16,7 @@ except ImportError:
 def arg_to_iter(
     arg: Union[None, Iterable, Any],
     *additional_iter_single_values: Iterable,
-    default_iter_single_values: Tuple = (bytes, dict, str)
+    default_iter_single_values: Tuple = (bytes, dict, str),
 ) -> Iterable:
     """Convert an argument to an iterable.
 
@@ -54,35 +59,147 @@ def arg_to_iter(
 
 
 @export
-def chunk_iter(iterable, chunk_size):
+def chunk_iter(
+    iterable,
+    chunk_size,
+    lazy: bool = False,
+    drop_last: bool = False,
+    pad: bool = False,
+    fillvalue: Any = None,
+):
     """
     Split an iterable into successive chunks using index subscriptions.
 
+    Sized, subscriptable objects (sequences, NumPy arrays, ...) are sliced,
+    other iterables, such as generators and files, are read `chunk_size`
+    items at a time into tuples.
+
+    With `lazy=True` the chunks are yielded one at a time, rather than
+    returned together, so only one chunk is held in memory. `bytes`,
+    `bytearray` and `mmap` objects are then chunked without copying,
+    as `memoryview` slices, and NumPy arrays as views.
+
     Args:
     ----
         iterable (iterable): An iterable to split into chunks.
         chunk_size (int): The size of each chunk.
+        lazy (bool): Return a generator of the chunks. Defaults to False.
+        drop_last (bool): Drop the last chunk if it's short. Defaults to False.
+        pad (bool): Pad the last chunk to `chunk_size` with `fillvalue`,
+            padded chunks are copies. Strings padded with anything but
+            a string are padded as tuples. Defaults to False.
+        fillvalue (Any): The padding, an int or a single byte for bytes.
+            Defaults to None, or 0 for bytes and arrays.
 
     Examples:
     --------
     >>> chunk_iter([1, 2, 3, 4, 5, 6, 7, 8, 9, 10], 2)
     ([1, 2], [3, 4], [5, 6], [7, 8], [9, 10])
 
+    >>> chunk_iter(iter(range(5)), 2, pad=True)
+    ((0, 1), (2, 3), (4, None))
+
+    >>> [bytes(chunk) for chunk in chunk_iter(b"abcde", 2, lazy=True, drop_last=True)]
+    [b'ab', b'cd']
+
     Returns:
     -------
-        tuple: A tuple containing chunks of the iterable.
+        tuple: A tuple containing chunks of the iterable, or a generator if lazy.
+
+    Raises:
+    ------
+        ValueError: If bytes are padded with anything but an int in range(256)
+            or a single byte.
     """
-    return tuple(
-        iterable[pos : pos + chunk_size] for pos in range(0, len(iterable), chunk_size)
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, not {chunk_size}.")
+    if drop_last and pad:
+        raise ValueError("Use either drop_last or pad, not both.")
+
+    if lazy and isinstance(iterable, (bytes, bytearray, mmap.mmap)):
+        iterable = memoryview(iterable)
+
+    if _is_sliceable(iterable):
+        chunks = _slice_chunks(iterable, chunk_size, drop_last, pad, fillvalue)
+    else:
+        chunks = _read_chunks(iterable, chunk_size, drop_last, pad, fillvalue)
+
+    return chunks if lazy else tuple(chunks)
+
+
+def _slice_chunks(sequence, chunk_size, drop_last, pad, fillvalue):
+    length = len(sequence)
+    stop = length - length % chunk_size if drop_last else length
+
+    for start in range(0, stop, chunk_size):
+        chunk = sequence[start : start + chunk_size]
+        if pad and start + chunk_size > length:
+            chunk = _pad_chunk(chunk, start + chunk_size - length, fillvalue)
+        yield chunk
+
+
+def _read_chunks(iterable, chunk_size, drop_last, pad, fillvalue):
+    iterator = iter(iterable)
+
+    while True:
+        chunk = tuple(islice(iterator, chunk_size))
+        if len(chunk) < chunk_size:
+            if chunk and not drop_last:
+                yield chunk + (fillvalue,) * (chunk_size - len(chunk)) if pad else chunk
+            return
+        yield chunk
+
+
+def _pad_chunk(chunk, missing: int, fillvalue: Any):
+    """Copy the chunk, padded with `missing` fillvalues, keeping its type where possible."""
+    if _is_ndarray(chunk):
+        numpy = sys.modules["numpy"]
+        padding = numpy.full(
+            (missing, *chunk.shape[1:]),
+            0 if fillvalue is None else fillvalue,
+            dtype=chunk.dtype,
+        )
+        return numpy.concatenate([chunk, padding])
+    if isinstance(chunk, (bytes, bytearray, memoryview)):
+        if fillvalue is None:
+            fillvalue = b"\x00"
+        elif isinstance(fillvalue, int) and 0 <= fillvalue < 256:
+            fillvalue = bytes([fillvalue])
+        elif not isinstance(fillvalue, (bytes, bytearray)) or len(fillvalue) != 1:
+            raise ValueError(
+                f"Bytes are padded with an int in range(256) or a single byte, not {fillvalue!r}."
+            )
+        return bytes(chunk) + bytes(fillvalue) * missing
+    if isinstance(chunk, str) and isinstance(fillvalue, str):
+        return chunk + fillvalue * missing
+    if isinstance(chunk, list):
+        return chunk + [fillvalue] * missing
+    return tuple(chunk) + (fillvalue,) * missing
+
+
+def _is_sliceable(obj: Any) -> bool:
+    # Mappings are subscriptable too, but by key
+    cls = type(obj)
+    return (
+        hasattr(cls, "__len__")
+        and hasattr(cls, "__getitem__")
+        and not isinstance(obj, Mapping)
     )
 
 
+def _is_ndarray(obj: Any) -> bool:
+    # NumPy is only checked for once it's been imported, by the caller
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(obj, numpy.ndarray)
+
+
 @export
-def flatten(sequence: Union[Iterable, Any]) -> List:
+def flatten(sequence: Union[Iterable, Any], max_depth: Optional[int] = None) -> List:
     """Flatten a sequence into a single, flat list.
 
     Returns a single, flat list which contains all elements retrieved
     from the sequence and all recursively contained sub-sequences (iterables).
+    See `iflatten`, which this collects into a list.
 
     Examples:
     --------
@@ -95,19 +212,74 @@ def flatten(sequence: Union[Iterable, Any]) -> List:
     >>> flatten(["foo", ["baz", 42], "bar"])
     ['foo', 'baz', 42, 'bar']
     """
-    result = []
+    return list(iflatten(sequence, max_depth))
 
-    # Recursive helper function to flatten a sequence
-    def _flatten(seq: Union[Iterable, Any]):
-        nonlocal result
-        for el in seq:
-            if hasattr(el, "__iter__") and not isinstance(el, (str, bytes)):
-                _flatten(el)
-            else:
-                result.append(el)
 
-    _flatten(sequence)
-    return result
+@export
+def iflatten(
+    sequence: Union[Iterable, Any], max_depth: Optional[int] = None
+) -> Iterator:
+    """Lazily flatten a sequence, yielding its elements one at a time.
+
+    Nested iterables, other than strings and bytes, are flattened using
+    an explicit stack rather than recursion, so there's no limit on the
+    nesting, and only the current path through the sequence is held in memory.
+    Sequences that contain themselves raise a ValueError.
+
+    Args:
+    ----
+        sequence (Iterable): The sequence to flatten.
+        max_depth (int): How many levels of nesting to flatten, None for all. Defaults to None.
+
+    Examples:
+    --------
+    >>> list(iflatten([1, [2, [3, [4]]]]))
+    [1, 2, 3, 4]
+    >>> list(iflatten([1, [2, [3, [4]]]], max_depth=1))
+    [1, 2, [3, [4]]]
+    """
+    max_stack = sys.maxsize if max_depth is None else max_depth + 1
+    containers = _CONTAINER_TYPES
+    stack = [iter(sequence)]
+    # The ids of the containers being flattened, to catch ones containing themselves
+    path = [id(sequence)]
+    on_path = {id(sequence)}
+
+    while stack:
+        for element in stack[-1]:
+            element_type = type(element)
+            try:
+                is_container = containers[element_type]
+            except KeyError:
+                is_container = _is_container_type(element_type)
+
+            if is_container and len(stack) < max_stack:
+                element_id = id(element)
+                if element_id in on_path:
+                    raise ValueError("Can't flatten a sequence that contains itself.")
+                stack.append(iter(element))
+                path.append(element_id)
+                on_path.add(element_id)
+                break
+            yield element
+        else:
+            stack.pop()
+            on_path.remove(path.pop())
+
+
+# type -> whether `iflatten` flattens its instances
+_CONTAINER_TYPES: Dict[type, bool] = {}
+
+
+def _is_container_type(element_type: type) -> bool:
+    if len(_CONTAINER_TYPES) > 1024:  # Classes made on the fly
+        _CONTAINER_TYPES.clear()
+
+    is_container = hasattr(element_type, "__iter__") and not issubclass(
+        element_type, (str, bytes)
+    )
+    _CONTAINER_TYPES[element_type] = is_container
+    return is_container
 
 
 @export
@@ -136,28 +308,232 @@ def all_indicies(iterable: Union[str, Iterable], obj: Any) -> Tuple[int]:
         AttributeError: If the iterable does not have an __iter__ attribute.
         ValueError: If the object is not found in the iterable.
     """
+    indices = tuple(iter_indices(iterable, obj))
+    if not indices:
+        raise ValueError()
+    return indices
+
+
+@export
+def iter_indices(iterable: Union[str, Iterable], obj: Any) -> Iterator[int]:
+    """Lazily yield the indices of an object in an iterable, in order.
+
+    Strings, bytes and memory maps are searched for `obj` as a substring,
+    matches can overlap. NumPy arrays yield the flat indices of the
+    elements equal to `obj`. Any other iterable is compared element by element.
+
+    Examples:
+    --------
+    >>> list(iter_indices("banana", "ana"))
+    [1, 3]
+    >>> next(iter_indices(range(10**9), 42))
+    42
+    >>> list(iter_indices([1, 2, 3], 4))
+    []
+
+    Raises:
+    ------
+        AttributeError: If the iterable does not have an __iter__ attribute.
+    """
     if not hasattr(iterable, "__iter__"):
         raise AttributeError()
 
-    indices, split = [], 0
-    while split < len(iterable):
-        try:
-            indices.append(iterable[split:].index(obj) + split)
-            split = indices[-1] + 1
-        except ValueError:  # obj not in this chunk of the iterable
-            break
+    if isinstance(iterable, (str, bytes, bytearray, mmap.mmap)):
+        return _find_indices(iterable, obj)
+    if isinstance(iterable, (list, tuple)):
+        return _index_indices(iterable, obj)
+    if _is_ndarray(iterable):
+        return iter(sys.modules["numpy"].flatnonzero(iterable == obj).tolist())
+    return (index for index, item in enumerate(iterable) if item == obj)
 
-    if not indices:
-        raise ValueError()
-    return tuple(indices)
-
-    # indicies = []
-    # for i, item in enumerate(iterable):
-    #     if item == obj:
-    #         indices.append(i)
-    # if not indices:
-    #     raise ValueError()
-    # return tuple(indices)
+
+def _find_indices(text, substring):
+    find, stop = text.find, len(text)
+    index = find(substring)
+    while 0 <= index < stop:  # An empty substring is found at len(text)
+        yield index
+        index = find(substring, index + 1)
+
+
+def _index_indices(sequence, obj):
+    index, index_of = -1, sequence.index
+    try:
+        while True:
+            index = index_of(obj, index + 1)
+            yield index
+    except ValueError:  # No more in the sequence
+        return
+
+
+@export
+class AhoCorasick:
+    """
+    Find every occurrence of many patterns in a text in one pass, with an
+    Aho-Corasick automaton. The automaton is built once, and can be reused
+    for any number of texts, or pickled and sent to other processes.
+
+    The patterns are all strings, or all bytes, and the texts searched must
+    be the same type. Bytes patterns search any bytes-like object, e.g. an mmap.
+
+    Modes:
+    -----
+        "overlapping": Every occurrence of every pattern.
+        "leftmost_longest": Non-overlapping occurrences, scanning left to right
+            and taking the longest pattern starting at each match.
+
+    Examples:
+    --------
+    >>> automaton = AhoCorasick(["he", "she", "hers"])
+    >>> automaton.findall("ushers")
+    {'he': (2,), 'she': (1,), 'hers': (2,)}
+    >>> AhoCorasick(["he", "she", "hers"], "leftmost_longest").findall("ushers")
+    {'he': (), 'she': (1,), 'hers': ()}
+    >>> list(automaton.finditer("she"))
+    [(0, 'she'), (1, 'he')]
+    """
+
+    MODES = ("overlapping", "leftmost_longest")
+
+    def __init__(
+        self, patterns: Iterable[Union[str, bytes]], mode: str = "overlapping"
+    ):
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {self.MODES}, not {mode!r}.")
+
+        self.patterns: Tuple[Union[str, bytes], ...] = tuple(dict.fromkeys(patterns))
+        self.mode = mode
+
+        if not all(isinstance(pattern, (str, bytes)) for pattern in self.patterns):
+            raise TypeError("patterns must be strings or bytes.")
+        kinds = {isinstance(pattern, bytes) for pattern in self.patterns}
+        if len(kinds) > 1:
+            raise TypeError("patterns must be all strings, or all bytes.")
+        if not all(self.patterns):
+            raise ValueError("patterns can't be empty.")
+
+        self._is_bytes = kinds == {True}
+        self._lengths = tuple(map(len, self.patterns))
+        self._longest = max(self._lengths, default=0)
+        self._transitions, self._outputs = self._build()
+
+    def _build(self) -> Tuple[List[Dict[Any, int]], List[Tuple[int, ...]]]:
+        """
+        Build the trie of the patterns, then turn it into a DFA. Each state maps
+        a symbol to the next state, symbols that lead back to the root are left out.
+        Each state's outputs are the patterns ending there, longest first.
+        """
+        trie: List[Dict[Any, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+        for pattern_index, pattern in enumerate(self.patterns):
+            state = 0
+            for symbol in pattern:  # Bytes iterate as ints
+                if symbol not in trie[state]:
+                    trie[state][symbol] = len(trie)
+                    trie.append({})
+                    outputs.append([])
+                state = trie[state][symbol]
+            outputs[state].append(pattern_index)
+
+        # Breadth first, so a state's failure state is complete before it
+        transitions: List[Dict[Any, int]] = [dict(trie[0])]
+        transitions.extend({} for _ in range(len(trie) - 1))
+        failures = [0] * len(trie)
+        queue = deque(trie[0].values())
+
+        while queue:
+            state = queue.popleft()
+            failure = failures[state]
+            outputs[state].extend(outputs[failure])
+
+            # Fall back to the failure state's transitions, then override them
+            transitions[state] = dict(transitions[failure])
+            for symbol, child in trie[state].items():
+                failures[child] = transitions[failure].get(symbol, 0)
+                transitions[state][symbol] = child
+                queue.append(child)
+
+        return transitions, [tuple(output) for output in outputs]
+
+    # ... Searching ...
+    def finditer(
+        self, text: Union[str, bytes]
+    ) -> Iterator[Tuple[int, Union[str, bytes]]]:
+        """
+        Lazily yield `(index, pattern)` for each match, in the order the matches
+        end. For "leftmost_longest" that's also the order they start.
+        """
+        patterns = self.patterns
+        for start, pattern_index in self._matches(text):
+            yield start, patterns[pattern_index]
+
+    def findall(self, text: Union[str, bytes]) -> Dict[Union[str, bytes], Tuple[int]]:
+        """
+        Map every pattern to the indices it's found at in the text, the same as
+        `all_indicies`, but an empty tuple for the patterns that aren't found.
+        """
+        indices: List[List[int]] = [[] for _ in self.patterns]
+        for start, pattern_index in self._matches(text):
+            indices[pattern_index].append(start)
+        return dict(zip(self.patterns, map(tuple, indices)))
+
+    def _matches(self, text: Union[str, bytes]) -> Iterator[Tuple[int, int]]:
+        if self._is_bytes:
+            if not isinstance(text, (bytes, bytearray)):
+                text = memoryview(text).cast("B")  # Iterates as ints, like bytes
+        elif not isinstance(text, str):
+            raise TypeError(f"Expected a str to search, not {type(text).__name__}.")
+
+        matches = self._overlapping(text)
+        if self.mode == "leftmost_longest":
+            matches = self._leftmost_longest(matches)
+        return matches
+
+    def _overlapping(self, text: Union[str, bytes]) -> Iterator[Tuple[int, int]]:
+        transitions, outputs, lengths = self._transitions, self._outputs, self._lengths
+
+        state = 0
+        for end, symbol in enumerate(text, 1):
+            state = transitions[state].get(symbol, 0)
+            if outputs[state]:
+                for pattern_index in outputs[state]:
+                    yield end - lengths[pattern_index], pattern_index
+
+    def _leftmost_longest(
+        self, matches: Iterator[Tuple[int, int]]
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Pick the leftmost longest matches out of the overlapping matches. Matches
+        arrive in the order they end, so the leftmost match is only known once
+        no later match could start before it.
+        """
+        lengths, longest = self._lengths, self._longest
+        pending: List[Tuple[int, int, int]] = []  # (start, -length, pattern_index)
+        taken_until = 0
+
+        def take():
+            nonlocal pending, taken_until
+            start, _, pattern_index = min(pending)
+            taken_until = start + lengths[pattern_index]
+            pending = [match for match in pending if match[0] >= taken_until]
+            return start, pattern_index
+
+        for start, pattern_index in matches:
+            # Later matches end at or after this one, so start after `earliest`
+            earliest = start + lengths[pattern_index] - longest
+            while pending and min(pending)[0] < earliest:
+                yield take()
+
+            if start >= taken_until:
+                pending.append((start, -lengths[pattern_index], pattern_index))
+
+        while pending:
+            yield take()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}"
+            f"(<{len(self.patterns)} patterns>, mode={self.mode!r})"
+        )
 
 
 @export
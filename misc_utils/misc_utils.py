@@ -1,11 +1,14 @@
 from pathlib import Path
+import itertools
 import json
-from typing import Any, Union
+import mmap
+import os
+from typing import Any, List, Optional, Tuple, Union
 
 try:
-    from .decorator_utils import export
+    from .decorator_utils import export, _EXECUTOR_TYPES, _shared_executor
 except ImportError:
-    from decorator_utils import export
+    from decorator_utils import export, _EXECUTOR_TYPES, _shared_executor
 
 
 @export
@@ -121,3 +124,84 @@ def ordinal(n: int) -> str:
         suffix = "th"
 
     return str(n) + suffix
+
+
+@export
+def search_file(
+    path: Union[str, Path],
+    pattern: Union[bytes, str],
+    chunk_size: int = 64 * 2**20,
+    executor: str = "process",
+    max_workers: Optional[int] = None,
+) -> Tuple[int]:
+    """Find all byte offsets of a pattern in a file, without reading it into memory.
+
+    The file is split into chunks, overlapping by `len(pattern) - 1` bytes so
+    matches spanning two chunks are found once. Each chunk is memory-mapped and
+    searched by a pool of workers, so memory use depends on the chunk size and
+    the worker count, not on the size of the file. Files of a single chunk, or
+    where a pool can't be started, are searched serially.
+
+    Args:
+    ----
+        path (Union[str, Path]): The file to search.
+        pattern (Union[bytes, str]): The pattern to find, strings are encoded as UTF-8.
+        chunk_size (int): Bytes searched per task. Defaults to 64 MiB.
+        executor (str): Either "process" or "thread". Defaults to "process".
+        max_workers (int): The pool's worker count. Defaults to the executor's default.
+
+    Returns:
+    -------
+        Tuple[int]: The offsets of every match, overlapping matches included,
+            in order. Empty if the pattern isn't found.
+    """
+    if isinstance(pattern, str):
+        pattern = pattern.encode("utf-8")
+    if not pattern:
+        raise ValueError("pattern can't be empty.")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, not {chunk_size}.")
+    if executor not in _EXECUTOR_TYPES:
+        raise ValueError(
+            f"executor must be one of {tuple(_EXECUTOR_TYPES)}, not {executor!r}."
+        )
+
+    path = os.fspath(path)
+    size = os.path.getsize(path)
+    starts = range(0, size, chunk_size)
+    chunks = [(path, pattern, start, min(start + chunk_size, size)) for start in starts]
+
+    if len(chunks) > 1:
+        try:
+            pool, _ = _shared_executor(executor, max_workers)
+            offsets = pool.map(_search_chunk, *zip(*chunks))
+            return tuple(itertools.chain.from_iterable(offsets))
+        except (OSError, NotImplementedError):  # e.g. no multiprocessing support
+            pass
+
+    return tuple(
+        itertools.chain.from_iterable(_search_chunk(*chunk) for chunk in chunks)
+    )
+
+
+def _search_chunk(path: str, pattern: bytes, start: int, stop: int) -> List[int]:
+    """
+    The offsets of the matches starting in `[start, stop)`. Maps the chunk
+    and the `len(pattern) - 1` bytes after it, from a page boundary.
+    """
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        offset = start - start % mmap.ALLOCATIONGRANULARITY
+        end = min(stop + len(pattern) - 1, size)
+        if end - start < len(pattern):
+            return []
+
+        with mmap.mmap(
+            file.fileno(), end - offset, access=mmap.ACCESS_READ, offset=offset
+        ) as mapped:
+            offsets, find = [], mapped.find
+            index = find(pattern, start - offset)
+            while index != -1:
+                offsets.append(offset + index)
+                index = find(pattern, index + 1)
+            return offsets
@@ -1,5 +1,12 @@
 from typing import Any, Callable, Dict, Tuple, Type, Union, Mapping, Iterable, Optional
+import collections
+import functools
 import inspect
+import itertools
+import keyword
+import sys
+import threading
+import weakref
 
 try:
     from .decorator_utils import export
@@ -21,53 +28,195 @@ kwargs_sig = inspect.Signature(
     [inspect.Parameter("kwargs", inspect.Parameter.VAR_KEYWORD)]
 )
 
+_POSITIONAL_KINDS = frozenset((POSITIONAL_ONLY, POSITIONAL_OR_KEYWORD, VAR_POSITIONAL))
+_KEYWORD_KINDS = frozenset((POSITIONAL_OR_KEYWORD, KEYWORD_ONLY, VAR_KEYWORD))
+
+# Marks arguments that weren't passed to a generated binder
+_MISSING = object()
+
+
+def _source_parameters(
+    parameters: Iterable[inspect.Parameter],
+    namespace: Dict[str, Any],
+    apply_defaults: bool = True,
+) -> Optional[list]:
+    """
+    Write `parameters` as the parameter list of a generated function.
+
+    Default values are placed in `namespace`, or replaced with `_MISSING`
+    when `apply_defaults` is False. Returns None if a parameter can't be
+    written as Python source.
+    """
+    namespace.setdefault("__MISSING__", _MISSING)
+    parameters = tuple(parameters)
+    source_params = []
+    needs_kw_only_marker = True
+
+    for index, param in enumerate(parameters):
+        param_name = param.name
+        if (
+            not param_name.isidentifier()
+            or keyword.iskeyword(param_name)
+            or param_name.startswith("__")
+        ):
+            return None
+
+        if param.kind is VAR_POSITIONAL:
+            source_params.append(f"*{param_name}")
+            needs_kw_only_marker = False
+        elif param.kind is VAR_KEYWORD:
+            source_params.append(f"**{param_name}")
+        else:
+            if param.kind is KEYWORD_ONLY and needs_kw_only_marker:
+                source_params.append("*")
+                needs_kw_only_marker = False
+
+            if param.default is EMPTY:
+                source_params.append(param_name)
+            elif apply_defaults:
+                namespace[f"__default_{index}__"] = param.default
+                source_params.append(f"{param_name}=__default_{index}__")
+            else:
+                source_params.append(f"{param_name}=__MISSING__")
+
+            if param.kind is POSITIONAL_ONLY and (
+                index + 1 == len(parameters)
+                or parameters[index + 1].kind is not POSITIONAL_ONLY
+            ):
+                source_params.append("/")
+
+    return source_params
+
+
+def _compile_function(
+    source_params: list, body: list, name: str, namespace: Dict[str, Any]
+) -> Callable:
+    """
+    Compile a function from its parameter list and body lines.
+
+    `name` may be a qualified name, e.g. `"A.__init__"`. The function is
+    defined under it, so the `TypeError`s of invalid calls name it.
+    """
+    short_name = name.rpartition(".")[2]
+    if not short_name.isidentifier() or short_name in namespace:
+        short_name = "__generated__"  # e.g. "<lambda>"
+
+    source = "\n".join((f"def {short_name}({', '.join(source_params)}):", *body))
+    exec(compile(source, f"<generated {name}>", "exec"), namespace)
+
+    function = namespace.pop(short_name)
+    function.__qualname__ = name
+    return function
+
+
+def _compile_binder(
+    signature: inspect.Signature, name: str = "bind", apply_defaults: bool = True
+) -> Optional[Callable[..., Dict[str, Any]]]:
+    """
+    Generate a function with the parameter list of `signature`, which returns
+    the arguments it was called with as a dict of parameter names to values.
+
+    The interpreter's own argument parsing does the binding, so the result
+    matches `signature.bind(...).arguments` (after `apply_defaults()` if
+    `apply_defaults` is True) and invalid calls raise the same `TypeError`s.
+
+    Returns None if the signature can't be written as Python source.
+
+    >>> bind = _compile_binder(inspect.signature(lambda a, b=2, *args: ...))
+    >>> bind(1)
+    {'a': 1, 'b': 2, 'args': ()}
+    """
+    namespace = {}
+    parameters = tuple(signature.parameters.values())
+
+    source_params = _source_parameters(parameters, namespace, apply_defaults)
+    if source_params is None:
+        return None
+
+    if apply_defaults:  # A dict display is the fastest way to build the result
+        items = ", ".join(f"{p.name!r}: {p.name}" for p in parameters)
+        return _compile_function(
+            source_params, [f"    return {{{items}}}"], name, namespace
+        )
+
+    # Without defaults applied, arguments that weren't passed are left out
+    body = ["    __arguments__ = {}"]
+    for param in parameters:
+        if param.kind in (VAR_POSITIONAL, VAR_KEYWORD):
+            condition = f"if {param.name}: "
+        elif param.default is not EMPTY:
+            condition = f"if {param.name} is not __MISSING__: "
+        else:
+            condition = ""
+        body.append(f"    {condition}__arguments__[{param.name!r}] = {param.name}")
+    body.append("    return __arguments__")
+
+    return _compile_function(source_params, body, name, namespace)
+
+
+def _signature_binder(signature: inspect.Signature) -> Callable[..., Dict[str, Any]]:
+    """The `inspect` equivalent of `_compile_binder`, used when it can't be compiled."""
+
+    def bind(*args, **kwargs) -> Dict[str, Any]:
+        bound_args = signature.bind(*args, **kwargs)
+        bound_args.apply_defaults()
+        return dict(bound_args.arguments)
+
+    return bind
+
 
 @export
 class Param:
+    __slots__ = ("name", "built_in_kind", "default", "annotation")
+
     def __init__(self, inspect_param: inspect.Parameter):
         self.name: str = inspect_param.name
-        self.kind: str = str(inspect_param.kind).split(".")[-1]
         self.default: Any = inspect_param.default
         self.annotation: Any = inspect_param.annotation
 
         self.built_in_kind: inspect.Parameter.kind = inspect_param.kind
 
+    @property
+    def kind(self) -> str:
+        """The name of the parameter kind, e.g. `"POSITIONAL_ONLY"`."""
+        return self.built_in_kind.name
+
     # ... Argument kind ...
     @property
     def can_pass_pos_arg(self) -> bool:
         """Check if the parameter can be passed as a positional argument."""
-        return self.is_pos_only or self.is_pos_or_kw or self.is_var_pos
+        return self.built_in_kind in _POSITIONAL_KINDS
 
     @property
     def can_pass_kw_arg(self) -> bool:
         """Check if the parameter can be passed as a keyword argument."""
-        return self.is_pos_or_kw or self.is_kw_only or self.is_var_kw
+        return self.built_in_kind in _KEYWORD_KINDS
 
     # ... Param kind ...
     @property
     def is_pos_only(self) -> bool:
         """Check if the parameter is positional only."""
-        return self.kind == "POSITIONAL_ONLY"
+        return self.built_in_kind is POSITIONAL_ONLY
 
     @property
     def is_pos_or_kw(self) -> bool:
         """Check if the parameter is positional or keyword."""
-        return self.kind == "POSITIONAL_OR_KEYWORD"
+        return self.built_in_kind is POSITIONAL_OR_KEYWORD
 
     @property
     def is_var_pos(self) -> bool:
         """Check if the parameter is variable positional."""
-        return self.kind == "VAR_POSITIONAL"
+        return self.built_in_kind is VAR_POSITIONAL
 
     @property
     def is_kw_only(self) -> bool:
         """Check if the parameter is keyword only."""
-        return self.kind == "KEYWORD_ONLY"
+        return self.built_in_kind is KEYWORD_ONLY
 
     @property
     def is_var_kw(self) -> bool:
         """Check if the parameter is variable keyword."""
-        return self.kind == "VAR_KEYWORD"
+        return self.built_in_kind is VAR_KEYWORD
 
     # ... Default ...
     @property
@@ -88,20 +237,169 @@ class Param:
     def __eq__(self, other):
         return (
             self.name == other.name
-            and self.kind == other.kind
+            and self.built_in_kind == other.built_in_kind
             and self.default == other.default
             and self.annotation == other.annotation
         )
 
 
+@export
+class SignatureCache:
+    """
+    Process-wide cache for values derived from a function's signature.
+
+    Entries are keyed by the underlying function object and held weakly, so
+    a cached function can still be garbage collected. Bound methods share the
+    entry of their `__func__`, so every instance of a class reuses one entry.
+
+    Each entry holds one value per variant, e.g. the parameters of a function
+    with `self` removed and with `self` kept.
+
+    >>> cache = SignatureCache()
+    >>> cache.get(some_func, False, lambda: "parsed")
+    'parsed'
+    >>> cache.get(some_func, False, lambda: "parsed")
+    'parsed'
+    >>> cache.info()
+    {'hits': 1, 'misses': 1, 'size': 1}
+    """
+
+    def __init__(self):
+        # id(key) -> (reference to key, {variant: value})
+        # Looking entries up by id avoids creating a weak reference per lookup.
+        self._entries: Dict[int, Tuple[Callable[[], Any], Dict[Any, Any]]] = {}
+        self._lock = threading.Lock()
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @staticmethod
+    def key_for(func: Callable) -> Any:
+        """Bound methods are keyed by the function they wrap."""
+        return getattr(func, "__func__", func)
+
+    def get(self, func: Callable, variant: Any, factory: Callable[[], Any]) -> Any:
+        """
+        Return the cached `variant` for `func`, calling `factory` on a miss.
+
+        Exceptions raised by `factory` propagate and nothing is cached.
+        """
+        key = self.key_for(func)
+        entry = self._find_entry(key)
+
+        if entry is not None and variant in entry:
+            self.hits += 1
+            return entry[variant]
+
+        value = factory()
+        with self._lock:
+            self.misses += 1
+            self._entry_for(key)[variant] = value
+        return value
+
+    def clear(self) -> None:
+        """Drop every entry and reset the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self)}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, func: Callable) -> bool:
+        return self._find_entry(self.key_for(func)) is not None
+
+    # ... Private Methods ...
+    def _find_entry(self, key: Any) -> Optional[Dict[Any, Any]]:
+        item = self._entries.get(id(key))
+        if item is not None and item[0]() is key:
+            return item[1]
+        return None
+
+    def _entry_for(self, key: Any) -> Dict[Any, Any]:
+        """Find or create the entry for `key`, must be called holding the lock."""
+        entry = self._find_entry(key)
+        if entry is not None:
+            return entry
+
+        try:
+            reference = weakref.ref(key, functools.partial(self._evict, id(key)))
+        except TypeError:  # cannot create weak reference
+            if getattr(key, "__self__", None) is not None:
+                # Holding e.g. a method-wrapper would keep its instance alive
+                # forever, so the value isn't cached.
+                return {}
+            # Builtin descriptors such as `object.__init__` live as long as
+            # the interpreter, so they can be held strongly.
+            reference = lambda: key
+
+        entry = {}
+        self._entries[id(key)] = (reference, entry)
+        return entry
+
+    def _evict(self, key_id: int, reference: weakref.ref) -> None:
+        """Weak reference callback, drops the entry of a collected function."""
+        item = self._entries.get(key_id)
+        if item is not None and item[0] is reference:
+            del self._entries[key_id]
+
+
+class _ParameterIndex:
+    """
+    Immutable views of a function's parameters, computed once and shared
+    between every `ParamProbe` of the function through `ParamProbe.cache`.
+    """
+
+    __slots__ = ("parameters", "names", "by_name", "by_kind")
+
+    # Parameter kinds and kind groups, see `ParamProbe._retrieve`
+    KEYS = (
+        "POSITIONAL_ONLY",
+        "POSITIONAL_OR_KEYWORD",
+        "VAR_POSITIONAL",
+        "KEYWORD_ONLY",
+        "VAR_KEYWORD",
+        "ALL_POSITIONAL",
+        "ALL_KEYWORD",
+        "ALL_PARAMETERS",
+    )
+
+    def __init__(self, parameters: Iterable[Param]):
+        self.parameters: Tuple[Param, ...] = tuple(parameters)
+        self.names: Tuple[str, ...] = tuple(param.name for param in self.parameters)
+        self.by_name: Dict[str, Param] = dict(zip(self.names, self.parameters))
+
+        by_kind = {key: [] for key in self.KEYS}
+        for param in self.parameters:
+            by_kind[param.kind].append(param)
+            if param.can_pass_pos_arg:
+                by_kind["ALL_POSITIONAL"].append(param)
+            if param.can_pass_kw_arg:
+                by_kind["ALL_KEYWORD"].append(param)
+        by_kind["ALL_PARAMETERS"] = self.parameters
+
+        self.by_kind: Dict[str, Tuple[Param, ...]] = {
+            key: tuple(params) for key, params in by_kind.items()
+        }
+
+
 @export
 class ParamProbe:
     """
     A wrapper around the inspect.signature(func).parameters object.
 
     Provides a subscriptable interface to the parameters of a function.
+
+    Parsed parameters are shared through `ParamProbe.cache`, so probing the
+    same function again skips `inspect.signature` entirely.
     """
 
+    cache = SignatureCache()
+
     def __init__(self, func: Callable, remove_self: bool = False):
         """
         The remove_self parameter for this constructor is only relevant for bound methods.
@@ -122,20 +420,7 @@ class ParamProbe:
         ('a', 'b', 'c')
         """
 
-        if inspect.isclass(func):
-            self.klass = func
-            self.func = self.klass.__init__
-            self.func_name = f"{self.klass.__name__}.__init__"
-        else:  # is function, method or callable object
-            try:  # function or method
-                self.func = func
-                self.func_name = func.__name__
-            except AttributeError:  # Callable object
-                self.klass = func.__class__
-                self.func = func.__call__
-                self.func_name = f"{self.klass.__name__}.__call__"
-
-        parameters = dict(inspect.signature(self.func).parameters)
+        self.func, self.func_name, self.klass = ParamProbe._resolve(func)
 
         # def some_func(a, b, c): ...
         # ...
@@ -163,29 +448,30 @@ class ParamProbe:
         manually_add_self_parameter = False
         if ParamProbe._is_bound_method(self.func):
             # The `self` parameter is automatically removed from bound methods.
-            if remove_self is True:
-                ...
-            else:
+            strip_self = True
+            if remove_self is False:
                 manually_add_self_parameter = True
         elif ParamProbe._is_unbound_method(self.func):
             # The `self` parameter isn't automatically removed from unbound methods.
-            if remove_self is True:
-                del parameters[tuple(parameters.keys())[0]]
-            else:
-                ...
+            strip_self = remove_self
         else:
             if remove_self is True:
                 raise ValueError(
                     f"Cannot remove `self` from `{self.func_name}` because it is not a method."
                 )
-            # no else, just pass on by
-
-        # Not assigned to instance, dynamic property instead.
-        parameters = tuple(
-            Param(inspect_param) for inspect_param in parameters.values()
+            strip_self = False
+
+        # Bound methods and their unbound function share one cache entry,
+        # the `self` of a bound method is instance specific so it's added below.
+        index = ParamProbe.cache.get(
+            self.func,
+            strip_self,
+            lambda: _ParameterIndex(
+                ParamProbe._parse_parameters(self.func, strip_self)
+            ),
         )
 
-        self._dict: Dict[str, Param] = {param.name: param for param in parameters}
+        self._dict: Dict[str, Param] = dict(index.by_name)
         if manually_add_self_parameter is True:
             if any([param.is_pos_only for param in self._dict.values()]):
                 kind = inspect.Parameter.POSITIONAL_ONLY
@@ -197,13 +483,16 @@ class ParamProbe:
             }
             self._d.update(self._dict)
             self._dict = self._d
+            index = _ParameterIndex(self._dict.values())
+
+        self._index: _ParameterIndex = index
 
     @property
     def parameters(self) -> Tuple[Param, ...]:
         """
-        Dynamic so __delitem__ only have to modify self._dict
+        Precomputed, __delitem__ rebuilds the index from self._dict
         """
-        return tuple(self._dict.values())
+        return self._index.parameters
 
     @property
     def instance(self) -> Any:
@@ -220,9 +509,9 @@ class ParamProbe:
     @property
     def names(self) -> Tuple[str, ...]:
         """
-        Dynamic so __delitem__ only have to modify self._dict
+        Precomputed, __delitem__ rebuilds the index from self._dict
         """
-        return tuple(self._dict.keys())
+        return self._index.names
 
     def __getitem__(self, key: str) -> Union[Param, Tuple[Param, ...]]:
         result = self._retrieve(key)
@@ -237,6 +526,7 @@ class ParamProbe:
     def __delitem__(self, key: str) -> None:
         for param in self._retrieve(key):
             del self._dict[param.name]
+        self._index = _ParameterIndex(self._dict.values())
 
     def get(self, key: str, default: Any = None) -> Union[Param, Tuple[Param, ...]]:
         try:
@@ -272,7 +562,46 @@ class ParamProbe:
 
         return f"{prepend}{self.func_name}{signature}"
 
+    @classmethod
+    def without_self(cls, func: Callable) -> "ParamProbe":
+        """
+        Probe `func` with `self` removed if it's a method, and untouched otherwise.
+        """
+        return cls(func, remove_self=cls._is_method(cls._resolve(func)[0]))
+
     # ... Private Methods ...
+    @staticmethod
+    def _resolve(func: Callable) -> Tuple[Callable, str, Optional[Type]]:
+        """
+        Return the function to inspect, its name, and the class it came from.
+
+        Classes are inspected through `__init__` and callable objects through `__call__`.
+        """
+        if inspect.isclass(func):
+            return func.__init__, f"{func.__name__}.__init__", func
+        try:  # function or method
+            return func, func.__name__, None
+        except AttributeError:  # Callable object
+            return func.__call__, f"{func.__class__.__name__}.__call__", func.__class__
+
+    @staticmethod
+    def _parse_parameters(func: Callable, strip_self: bool) -> Tuple[Param, ...]:
+        """
+        Parse the parameters of the function underlying `func`.
+
+        Bound methods are parsed through their `__func__`, so the result is the
+        same for every instance and can be cached under a single entry.
+        """
+        parameters = tuple(
+            inspect.signature(SignatureCache.key_for(func)).parameters.values()
+        )
+
+        # Mirror `inspect`, which never treats `*args` as the `self` of a bound method.
+        if strip_self and parameters and parameters[0].kind is not VAR_POSITIONAL:
+            parameters = parameters[1:]
+
+        return tuple(Param(inspect_param) for inspect_param in parameters)
+
     def _retrieve(self, key: Union[int, slice, str]) -> Tuple[Param, ...]:
         """
         Retrieve parameters based on the provided key, which can be a name, an index, a slice, or a kind.
@@ -335,24 +664,9 @@ class ParamProbe:
         # ... Parameter name ...
         elif key in self._dict:
             return (self._dict[key],)
-        # ... Parameter kinds ...
-        elif key == "POSITIONAL_ONLY":
-            return tuple(param for param in self.parameters if param.is_pos_only)
-        elif key == "POSITIONAL_OR_KEYWORD":
-            return tuple(param for param in self.parameters if param.is_pos_or_kw)
-        elif key == "VAR_POSITIONAL":
-            return tuple(param for param in self.parameters if param.is_var_pos)
-        elif key == "KEYWORD_ONLY":
-            return tuple(param for param in self.parameters if param.is_kw_only)
-        elif key == "VAR_KEYWORD":
-            return tuple(param for param in self.parameters if param.is_var_kw)
-        # ... Parameter kind groups ...
-        elif key == "ALL_POSITIONAL":
-            return tuple(param for param in self.parameters if param.can_pass_pos_arg)
-        elif key == "ALL_KEYWORD":
-            return tuple(param for param in self.parameters if param.can_pass_kw_arg)
-        elif key == "ALL_PARAMETERS":
-            return self.parameters
+        # ... Parameter kinds & kind groups ...
+        elif key in self._index.by_kind:
+            return self._index.by_kind[key]
 
         raise KeyError(
             (
@@ -441,69 +755,136 @@ class ArgMutator:
     {'pos_only': 1, 'pos_or_kw': 2, 'args': (3, 4)}
     """
 
+    # `bind` uses generated binders, rather than `inspect.Signature.bind`
+    compiled_bind: bool = True
+
     def __init__(self, func, *args, **kwargs):
-        try:
-            self.param_probe = ParamProbe(func, remove_self=True)
-        except ValueError:
-            self.param_probe = ParamProbe(func)
+        param_probe = ParamProbe.without_self(func)
+
+        # Construction is a single bind, the signatures and key splits
+        # below are only built when they're first used.
+        self._initialize(
+            param_probe,
+            param_probe.instance,
+            func,
+            args,
+            kwargs,
+            ArgMutator.bind(func, *args, **kwargs),
+        )
+
+    def _initialize(
+        self,
+        param_probe: ParamProbe,
+        instance: Any,
+        func: Callable,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        bound_arg_dict: Dict[str, Any],
+    ) -> None:
+        self.param_probe = param_probe
+
+        self.instance = instance
+        self.parameters = param_probe.names
 
-        self.instance = self.param_probe.instance
-        self.parameters = self.param_probe.names
+        self.func = param_probe.func
+        self.func_name = param_probe.func_name
 
-        self.func = self.param_probe.func
-        self.func_name = self.param_probe.func_name
+        self._callable = func
+        self._passed_args, self._passed_kwargs = args, kwargs
+        self._bound_arg_dict = bound_arg_dict
 
+        # `args`, `kwargs` and `values` are cached until the bindings change
+        self._args_view = self._kwargs_view = self._values_view = None
+        self._rebound = False
+
+        # Easier subscripting
+        by_kind = param_probe._index.by_kind
+        var_pos_param = by_kind["VAR_POSITIONAL"]
+        self.var_pos_param = var_pos_param[0].name if var_pos_param else None
+
+        var_kw_param = by_kind["VAR_KEYWORD"]
+        self.var_kw_param = var_kw_param[0].name if var_kw_param else None
+
+    @classmethod
+    def _prebound(
+        cls,
+        param_probe: ParamProbe,
+        instance: Any,
+        func: Callable,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        bound_arg_dict: Dict[str, Any],
+    ) -> "ArgMutator":
+        """
+        Build a mutator from arguments already bound to `param_probe`, by callers
+        which resolve the probe and binder once, rather than on every call.
+        """
+        mutator = cls.__new__(cls)
+        mutator._initialize(param_probe, instance, func, args, kwargs, bound_arg_dict)
+        return mutator
+
+    # ... Lazily built attributes ...
+    @functools.cached_property
+    def sig(self) -> inspect.Signature:
         # Working with methods, espically __init__ is a little tricky.
         # The easiest solution is to build a partial signature here
         # that excludes the `self` parameter. `self` can be accessed
         # via the `instance` property.
-        self.sig = inspect.Signature(
+        return inspect.Signature(
             inspect.Parameter(p.name, p.built_in_kind, default=p.default)
             for p in self.param_probe
         )
-        self.bound_args = self.sig.bind(*args, **kwargs)
-        self.bound_args.apply_defaults()
-        self._bound_arg_dict = dict(self.bound_args.arguments)
 
-        # Names of parameters, and how they were passed
-        self.pos_keys, self.kw_keys = [], []
+    @functools.cached_property
+    def bound_args(self) -> inspect.BoundArguments:
+        """The `inspect.BoundArguments` of the arguments passed to the constructor."""
+        bound_args = self.sig.bind(*self._passed_args, **self._passed_kwargs)
+        bound_args.apply_defaults()
+        return bound_args
+
+    @functools.cached_property
+    def _split_keys(self) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """Names of parameters, and how they were passed"""
+        pos_keys, kw_keys = [], []
         for param in self.param_probe:
             if param.is_pos_only:
-                self.pos_keys.append(param.name)
+                pos_keys.append(param.name)
 
             # Split this up, correctly
             elif param.is_pos_or_kw:
-                if param.name in kwargs:
-                    self.kw_keys.append(param.name)
+                if param.name in self._passed_kwargs:
+                    kw_keys.append(param.name)
                 else:
-                    self.pos_keys.append(param.name)
+                    pos_keys.append(param.name)
 
             elif param.is_var_pos:
-                self.pos_keys.append(param.name)
+                pos_keys.append(param.name)
             elif param.is_kw_only:
-                self.kw_keys.append(param.name)
+                kw_keys.append(param.name)
             elif param.is_var_kw:
-                self.kw_keys.append(param.name)
-        self.pos_keys, self.kw_keys = tuple(self.pos_keys), tuple(self.kw_keys)
+                kw_keys.append(param.name)
+        return tuple(pos_keys), tuple(kw_keys)
 
-        # Easier subscripting
-        try:
-            self.var_pos_param = self.param_probe["VAR_POSITIONAL"].name
-        except KeyError:
-            self.var_pos_param = None
+    @property
+    def pos_keys(self) -> Tuple[str, ...]:
+        return self._split_keys[0]
 
-        try:
-            self.var_kw_param = self.param_probe["VAR_KEYWORD"].name
-        except KeyError:
-            self.var_kw_param = None
+    @property
+    def kw_keys(self) -> Tuple[str, ...]:
+        return self._split_keys[1]
 
-        # Useful partial signatures
-        self.pos_sig = inspect.Signature(
+    # Useful partial signatures
+    @functools.cached_property
+    def pos_sig(self) -> inspect.Signature:
+        return inspect.Signature(
             inspect.Parameter(p.name, p.built_in_kind, default=p.default)
             for p in self.param_probe
             if p.name in self.pos_keys
         )
-        self.kw_sig = inspect.Signature(
+
+    @functools.cached_property
+    def kw_sig(self) -> inspect.Signature:
+        return inspect.Signature(
             inspect.Parameter(p.name, p.built_in_kind, default=p.default)
             for p in self.param_probe
             if p.name in self.kw_keys
@@ -517,20 +898,25 @@ class ArgMutator:
         For a tuple of positional arguments, use `args`.
         For a dict of keyword arguments, use `kwargs`.
         """
-        result = []
-        for key, value in self._bound_arg_dict.items():
-            if key == self.var_pos_param:
-                result.extend(value)
-            elif key == self.var_kw_param:
-                result.extend(value.values())
-            else:
-                result.append(value)
-        return tuple(result)
+        if self._values_view is None:
+            result = []
+            for key, value in self._bound_arg_dict.items():
+                if key == self.var_pos_param:
+                    result.extend(value)
+                elif key == self.var_kw_param:
+                    result.extend(value.values())
+                else:
+                    result.append(value)
+            self._values_view = tuple(result)
+        return self._values_view
 
     def asdict(self) -> Dict[str, Any]:
         """
         Return a dict of arguments passed to the function.
         Parameter names are keys and arguments are values.
+
+        Changes should be made through the mutator, e.g. `mutator[name] = value`,
+        so the cached `args`, `kwargs` and `values` are rebuilt.
         """
         return self._bound_arg_dict
 
@@ -540,13 +926,15 @@ class ArgMutator:
         """
         Return a tuple of arguments passed positionally to the function.
         """
-        result = []
-        for name in self.pos_keys:
-            if name == self.var_pos_param:
-                result.extend(self._bound_arg_dict[name])
-            else:
-                result.append(self._bound_arg_dict[name])
-        return tuple(result)
+        if self._args_view is None:
+            result = []
+            for name in self.pos_keys:
+                if name == self.var_pos_param:
+                    result.extend(self._bound_arg_dict[name])
+                else:
+                    result.append(self._bound_arg_dict[name])
+            self._args_view = tuple(result)
+        return self._args_view
 
     @args.setter
     def args(self, values: Iterable[Any]) -> None:
@@ -555,19 +943,15 @@ class ArgMutator:
 
         for key, value in dict(bound_args.arguments).items():
             self._bound_arg_dict[key] = value
+        self._invalidate_views()
 
     @property
     def kwargs(self) -> Dict[str, Any]:
         """
         Return a dict of arguments passed as keyword arguments to the function.
         """
-        result = {}
-        for name in self.kw_keys:
-            if name == self.var_kw_param:
-                result.update(self._bound_arg_dict[name])
-            else:
-                result[name] = self._bound_arg_dict[name]
-        return result
+        # A copy, so changing the result can't corrupt the cached view
+        return dict(self._kwargs)
 
     @kwargs.setter
     def kwargs(self, values: Dict[str, Any]) -> None:
@@ -576,6 +960,22 @@ class ArgMutator:
 
         for key, value in dict(bound_args.arguments).items():
             self._bound_arg_dict[key] = value
+        self._invalidate_views()
+
+    def call(self) -> Any:
+        """
+        Call the function with the current arguments.
+
+        >>> def func(a, b, *, c): return a + b + c
+        >>> mutator = ArgMutator(func, 1, 2, c=3)
+        >>> mutator["a"] = 10
+        >>> mutator.call()
+        15
+        """
+        if not self._rebound:
+            # Nothing has changed, so the arguments are passed on as they came
+            return self._callable(*self._passed_args, **self._passed_kwargs)
+        return self._callable(*self.args, **self._kwargs)
 
     # ... Dunder methods ...
     def __contains__(self, parameter_name: str) -> bool:
@@ -632,6 +1032,24 @@ class ArgMutator:
         except KeyError:
             return self._bound_arg_dict[self.var_kw_param][name]
 
+    @property
+    def _kwargs(self) -> Dict[str, Any]:
+        """The cached keyword arguments, must not be changed."""
+        if self._kwargs_view is None:
+            result = {}
+            for name in self.kw_keys:
+                if name == self.var_kw_param:
+                    result.update(self._bound_arg_dict[name])
+                else:
+                    result[name] = self._bound_arg_dict[name]
+            self._kwargs_view = result
+        return self._kwargs_view
+
+    def _invalidate_views(self) -> None:
+        """Drop the cached `args`, `kwargs` and `values`, after the bindings change."""
+        self._args_view = self._kwargs_view = self._values_view = None
+        self._rebound = True
+
     def _set_argument_value(self, name: str, value: Any) -> None:
         """Set the argument value for the given name."""
         if name == self.var_pos_param:  # Set directly as args
@@ -657,6 +1075,8 @@ class ArgMutator:
         else:
             raise KeyError(f"Unexpected keyword argument: {name}")
 
+        self._invalidate_views()
+
     # ... Subscriptable interface / Similar methods ...
     def __getitem__(self, key: Union[int, slice, str]) -> Dict[str, Any]:
         """
@@ -785,10 +1205,16 @@ class ArgMutator:
 
     @staticmethod
     def bind(func, *args, **kwargs) -> Dict[str, Any]:
-        try:
-            param_probe = ParamProbe(func, remove_self=True)
-        except ValueError:
-            param_probe = ParamProbe(func)
+        """
+        Bind the arguments to the parameters of `func`, applying defaults.
+
+        Uses the binder generated by `compile_binder`, unless `compiled_bind`
+        is set to False, in which case `inspect.Signature.bind` is used.
+        """
+        if ArgMutator.compiled_bind:
+            return ArgMutator.compile_binder(func)(*args, **kwargs)
+
+        param_probe = ParamProbe.without_self(func)
 
         sig = inspect.Signature(
             inspect.Parameter(p.name, p.built_in_kind, default=p.default)
@@ -799,34 +1225,146 @@ class ArgMutator:
         bound_args.apply_defaults()
         return dict(bound_args.arguments)
 
+    @staticmethod
+    def bind_many(
+        func,
+        calls: Iterable[Tuple[Tuple[Any, ...], Dict[str, Any]]],
+        columnar: bool = False,
+    ) -> Union[Iterable[Dict[str, Any]], Dict[str, list]]:
+        """
+        Bind many `(args, kwargs)` calls against `func`, resolving the binder once.
+
+        Returns a generator of bound argument dicts, or with `columnar=True`
+        a dict with one list of arguments per parameter.
+
+        >>> def func(a, b=2): ...
+        >>> calls = [((1,), {}), ((3,), {"b": 4})]
+        >>> list(ArgMutator.bind_many(func, calls))
+        [{'a': 1, 'b': 2}, {'a': 3, 'b': 4}]
+        >>> ArgMutator.bind_many(func, calls, columnar=True)
+        {'a': [1, 3], 'b': [2, 4]}
+        """
+        binder = ArgMutator.compile_binder(func)
+        bound = (binder(*args, **kwargs) for args, kwargs in calls)
+        if not columnar:
+            return bound
+
+        columns = {name: [] for name in ParamProbe.without_self(func).names}
+        appenders = tuple((name, column.append) for name, column in columns.items())
+        for arguments in bound:
+            for name, append in appenders:
+                append(arguments[name])
+        return columns
+
+    @staticmethod
+    def compile_binder(func) -> Callable[..., Dict[str, Any]]:
+        """
+        Return a function that binds arguments to the parameters of `func`.
+
+        The binder is generated once per signature and kept in `ParamProbe.cache`,
+        it has the same parameter list as `func` (without `self` for methods),
+        and returns the arguments as a dict, with defaults applied.
+
+        Invalid calls raise the `TypeError`s calling `func` would, which word
+        things differently to `inspect.Signature.bind`'s, and don't count `self`.
+
+        >>> def func(a, b, c=3): ...
+        >>> binder = ArgMutator.compile_binder(func)
+        >>> binder(1, b=2)
+        {'a': 1, 'b': 2, 'c': 3}
+        """
+        return ArgMutator._cached_plan(func, "binder", ArgMutator._build_binder)
+
     @staticmethod
     def missing_args(func, *args, **kwargs) -> Tuple[str, ...]:
-        try:
-            param_probe = ParamProbe(func, remove_self=True)
-        except ValueError:
-            param_probe = ParamProbe(func)
+        """
+        Return the names of the required parameters of `func` that the
+        arguments don't provide, in parameter order.
+
+        >>> def func(a, /, b, *args, c, d=4, **kwargs): ...
+        >>> ArgMutator.missing_args(func, 1, c=3)
+        ('b',)
+        """
+        required = ArgMutator._cached_plan(func, "required", ArgMutator._build_required)
+        return ArgMutator._missing(required, len(args), kwargs)
+
+    @staticmethod
+    def missing_args_many(
+        func, calls: Iterable[Tuple[Tuple[Any, ...], Dict[str, Any]]]
+    ) -> Tuple[Tuple[str, ...], ...]:
+        """
+        Run `missing_args` for each `(args, kwargs)` call, resolving `func` once.
 
-        missing_params = list(param_probe.names)
+        >>> def func(a, b, c=3): ...
+        >>> ArgMutator.missing_args_many(func, [((1, 2), {}), ((), {"b": 2})])
+        ((), ('a',))
+        """
+        required = ArgMutator._cached_plan(func, "required", ArgMutator._build_required)
+        missing = ArgMutator._missing
+        return tuple(missing(required, len(args), kwargs) for args, kwargs in calls)
 
-        for _ in range(len(args)):
-            missing_params.pop(0)
+    # ... Cached plans ...
+    @staticmethod
+    def _cached_plan(func, name: str, build: Callable[[ParamProbe], Any]) -> Any:
+        """
+        Return `build(ParamProbe.without_self(func))`, cached in `ParamProbe.cache`.
+        """
+        target = ParamProbe._resolve(func)[0]
+        # A bound method and its `__func__` share an entry, but only the
+        # bound method has `self` removed when it's a plain function.
+        return ParamProbe.cache.get(
+            target,
+            (name, ParamProbe._is_bound_method(target)),
+            lambda: build(ParamProbe.without_self(func)),
+        )
 
-        for key in kwargs:
-            missing_params.remove(key)
+    @staticmethod
+    def _build_binder(param_probe: ParamProbe) -> Callable[..., Dict[str, Any]]:
+        sig = inspect.Signature(
+            inspect.Parameter(p.name, p.built_in_kind, default=p.default)
+            for p in param_probe
+        )
 
-        # VAR_POSITIONAL and VAR_KEYWORD are not required
-        for key in ("VAR_POSITIONAL", "VAR_KEYWORD"):
-            try:
-                missing_params.remove(param_probe[key].name)
-            except (KeyError, ValueError):
-                ...
+        # Named after `func`, which invalid calls' `TypeError`s mention
+        if param_probe.klass is None:
+            name = getattr(param_probe.func, "__qualname__", param_probe.func_name)
+        else:
+            name = param_probe.func_name
+        binder = _compile_binder(sig, name)
+        return binder if binder is not None else _signature_binder(sig)
 
-        # Remove parameters with default values
-        for param in missing_params:
-            if param_probe[param].default is not EMPTY:
-                missing_params.remove(param)
+    @staticmethod
+    def _build_required(param_probe: ParamProbe) -> Tuple[Tuple[str, int, bool], ...]:
+        """
+        The required parameters, with the number of positional arguments
+        needed to reach them, and whether they can be passed by keyword.
+        """
+        required, position = [], 0
+        for param in param_probe:
+            # VAR_POSITIONAL and VAR_KEYWORD are not required
+            if param.is_var_pos or param.is_var_kw:
+                continue
+
+            if param.can_pass_pos_arg:
+                reached_by, position = position + 1, position + 1
+            else:
+                reached_by = sys.maxsize
 
-        return tuple(missing_params)
+            if param.default is EMPTY:
+                required.append((param.name, reached_by, param.can_pass_kw_arg))
+        return tuple(required)
+
+    @staticmethod
+    def _missing(
+        required: Tuple[Tuple[str, int, bool], ...],
+        arg_count: int,
+        kwargs: Mapping[str, Any],
+    ) -> Tuple[str, ...]:
+        return tuple(
+            name
+            for name, reached_by, can_pass_kw in required
+            if arg_count < reached_by and not (can_pass_kw and name in kwargs)
+        )
 
 
 @export
@@ -839,6 +1377,13 @@ def missing_args(func, *args, **kwargs) -> Tuple[str, ...]:
     return ArgMutator.missing_args(func, *args, **kwargs)
 
 
+@export
+def missing_args_many(
+    func, calls: Iterable[Tuple[Tuple[Any, ...], Dict[str, Any]]]
+) -> Tuple[Tuple[str, ...], ...]:
+    return ArgMutator.missing_args_many(func, calls)
+
+
 @export
 def build_signature(
     pos_only: Tuple[str, ...] = tuple(),
@@ -854,12 +1399,35 @@ def build_signature(
 
     You cannot call a signature, but can bind it to arguments.
 
+    Signatures are interned by their spec, so the same spec always returns the
+    same signature. Binding through `bind_args` / `bind_kwargs` uses a binder
+    generated once per spec, rather than `Signature.bind`.
+
     Example:
     --------
     >>> sig = build_signature(pos_or_kw('a', 'b', 'c'))
     >>> sig.bind(1, 2, 3).arguments
     {'a': 1, 'b': 2, 'c': 3}
     """
+    spec = (tuple(pos_only), tuple(pos_or_kw), var_pos, tuple(kw_only), var_kw)
+
+    if bind_args is None and bind_kwargs is None:
+        return _interned_signature(*spec)
+
+    args = bind_args or tuple()
+    kwargs = bind_kwargs or dict()
+    return _interned_binder(*spec)(*args, **kwargs)
+
+
+@functools.lru_cache(maxsize=1024)
+def _interned_signature(
+    pos_only: Tuple[str, ...],
+    pos_or_kw: Tuple[str, ...],
+    var_pos: Optional[str],
+    kw_only: Tuple[str, ...],
+    var_kw: Optional[str],
+) -> inspect.Signature:
+    """`build_signature` returns the same (immutable) signature for the same spec."""
     parameters = []
     for name in pos_only:
         parameters.append(inspect.Parameter(name, inspect.Parameter.POSITIONAL_ONLY))
@@ -873,19 +1441,27 @@ def build_signature(
         parameters.append(inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY))
     if var_kw is not None:
         parameters.append(inspect.Parameter(var_kw, inspect.Parameter.VAR_KEYWORD))
-    sig = inspect.Signature(parameters)
+    return inspect.Signature(parameters)
 
-    if bind_args is None and bind_kwargs is None:
-        return sig
-    elif bind_args is not None and bind_kwargs is None:
-        return sig.bind(*bind_args).arguments
-    elif bind_args is None and bind_kwargs is not None:
-        return sig.bind(**bind_kwargs).arguments
-    else:
-        args = bind_args or tuple()
-        kwargs = bind_kwargs or dict()
 
-        return sig.bind(*args, **kwargs).arguments
+@functools.lru_cache(maxsize=1024)
+def _interned_binder(
+    pos_only: Tuple[str, ...],
+    pos_or_kw: Tuple[str, ...],
+    var_pos: Optional[str],
+    kw_only: Tuple[str, ...],
+    var_kw: Optional[str],
+) -> Callable[..., Dict[str, Any]]:
+    """
+    Binder for `build_signature(..., bind_args=..., bind_kwargs=...)`, which
+    matches `sig.bind(...).arguments`, so defaults aren't applied.
+    """
+    sig = _interned_signature(pos_only, pos_or_kw, var_pos, kw_only, var_kw)
+
+    binder = _compile_binder(sig, "build_signature", apply_defaults=False)
+    if binder is None:
+        return lambda *args, **kwargs: dict(sig.bind(*args, **kwargs).arguments)
+    return binder
 
 
 @export
@@ -900,9 +1476,95 @@ def mapping_to_kwargs(func: Union[Type, Callable], mapping: Mapping):
     Returns:
         dict: A dictionary of keyword arguments.
     """
-    try:
-        params = ParamProbe(func, remove_self=True).names
-    except ValueError:
-        params = ParamProbe(func).names
+    params = ArgMutator._cached_plan(func, "names", lambda probe: probe.names)
 
     return {param: mapping[param] for param in params if param in mapping}
+
+
+@export
+class RecordLoader:
+    """
+    Turn mappings, e.g. JSON objects or CSV rows, into objects by passing
+    the keys that match the parameters of `func` (usually a class) as
+    keyword arguments. The parameter names are resolved once.
+
+    >>> loader = RecordLoader(SomeClass, track_dropped=True)
+    >>> objects = list(loader.load([{"a": 1, "b": 2, "c": 3, "d": 4}]))
+    >>> loader.dropped
+    Counter({'d': 1})
+
+    Parameters that can't be passed by keyword, such as positional only
+    parameters and `*args`, are never filled from a mapping.
+    """
+
+    def __init__(self, func: Union[Type, Callable], track_dropped: bool = False):
+        self.func = func
+        self.track_dropped = track_dropped
+        self.names: Tuple[str, ...] = tuple(
+            param.name
+            for param in ParamProbe.without_self(func)
+            if param.is_pos_or_kw or param.is_kw_only
+        )
+        self._name_set = frozenset(self.names)
+
+        # Keys found in the mappings which aren't parameters, and how often
+        self.dropped: collections.Counter = collections.Counter()
+
+    def load_one(self, mapping: Mapping) -> Any:
+        names = self.names
+        if self.track_dropped:
+            self.dropped.update(mapping.keys() - self._name_set)
+        return self.func(**{name: mapping[name] for name in names if name in mapping})
+
+    def load(
+        self,
+        mappings: Iterable[Mapping],
+        processes: Optional[int] = None,
+        chunk_size: int = 1000,
+    ) -> Iterable[Any]:
+        """
+        Lazily load every mapping, in order.
+
+        With `processes`, chunks of `chunk_size` mappings are loaded on a
+        process pool, which needs `func`, the mappings and the results to be
+        picklable. At most two chunks per process are in flight at once.
+        """
+        if processes is None:
+            return self._load_serial(mappings)
+        return self._load_parallel(mappings, processes, chunk_size)
+
+    # ... Private Methods ...
+    def _load_serial(self, mappings: Iterable[Mapping]) -> Iterable[Any]:
+        func, names = self.func, self.names
+        if not self.track_dropped:  # The hot path, a single dict comprehension
+            for mapping in mappings:
+                yield func(**{name: mapping[name] for name in names if name in mapping})
+        else:
+            for mapping in mappings:
+                yield self.load_one(mapping)
+
+    def _load_chunk(self, mappings: list) -> Tuple[list, collections.Counter]:
+        """Runs in a worker process, on a copy of the loader."""
+        self.dropped = collections.Counter()
+        return list(self._load_serial(mappings)), self.dropped
+
+    def _load_parallel(
+        self, mappings: Iterable[Mapping], processes: int, chunk_size: int
+    ) -> Iterable[Any]:
+        from concurrent.futures import ProcessPoolExecutor
+
+        mappings = iter(mappings)
+        chunks = iter(lambda: list(itertools.islice(mappings, chunk_size)), [])
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            in_flight = collections.deque(
+                executor.submit(self._load_chunk, chunk)
+                for chunk in itertools.islice(chunks, processes * 2)
+            )
+            while in_flight:
+                objects, dropped = in_flight.popleft().result()
+                for chunk in itertools.islice(chunks, 1):
+                    in_flight.append(executor.submit(self._load_chunk, chunk))
+
+                self.dropped.update(dropped)
+                yield from objects
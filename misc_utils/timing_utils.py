@@ -0,0 +1,353 @@
+import functools
+import inspect
+import json
+import threading
+import weakref
+from time import perf_counter_ns
+from typing import IO, Any, Callable, Dict, List, Optional, Union
+
+try:
+    from .decorator_utils import export
+except ImportError:
+    from decorator_utils import export
+
+
+# ... Histograms ...
+
+# Each power of two is split into 8 linear sub-buckets, so a bucket is at most
+# 1/8th of its lower bound wide. Durations under 8ns have exact buckets.
+SUB_BUCKET_BITS = 3
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+BUCKETS = (64 - SUB_BUCKET_BITS + 1) * SUB_BUCKETS
+
+
+def _bucket_index(ns: int) -> int:
+    """
+    >>> [_bucket_index(ns) for ns in (0, 7, 8, 15, 16, 17, 18)]
+    [0, 7, 8, 15, 16, 16, 17]
+    """
+    if ns < SUB_BUCKETS:
+        return ns
+    shift = ns.bit_length() - 1 - SUB_BUCKET_BITS
+    return (shift + 1) * SUB_BUCKETS + ((ns >> shift) & (SUB_BUCKETS - 1))
+
+
+def _bucket_bounds(index: int) -> tuple:
+    """
+    The `(lowest, highest)` durations in the bucket, in nanoseconds.
+
+    >>> [_bucket_bounds(index) for index in (7, 8, 16, 17)]
+    [(7, 7), (8, 8), (16, 17), (18, 19)]
+    """
+    if index < SUB_BUCKETS:
+        return index, index
+    shift = index // SUB_BUCKETS - 1
+    lowest = (SUB_BUCKETS + index % SUB_BUCKETS) << shift
+    return lowest, lowest + (1 << shift) - 1
+
+
+class _Shard:
+    """
+    One thread's counts, only that thread writes to it.
+    """
+
+    __slots__ = ("counts", "total", "max")
+
+    def __init__(self):
+        self.counts: List[int] = [0] * BUCKETS
+        self.total: int = 0
+        self.max: int = 0
+
+    def merge(self, other: "_Shard") -> None:
+        self.counts = list(map(sum, zip(self.counts, other.counts)))
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+
+class _ShardOwner:
+    """
+    Held in a thread's thread-local storage, it's collected when the thread
+    ends, which folds the thread's shard into the histogram's retired shard.
+    """
+
+    __slots__ = ("__weakref__",)
+
+
+@export
+class LatencyHistogram:
+    """
+    A fixed-bucket, log-linear histogram of durations in nanoseconds.
+
+    Each thread records into its own shard without locking, the shards
+    are merged when the histogram is read. When a thread ends its shard is
+    merged into a shared, retired shard. Percentiles are accurate to within
+    the width of a bucket, 1/8th of the duration.
+
+    >>> histogram = LatencyHistogram("example")
+    >>> for ns in range(1, 101):
+    ...     histogram.record(ns * 1000)
+    >>> histogram.count, histogram.max
+    (100, 100000)
+    >>> abs(histogram.percentile(50) - 50_000) <= 50_000 // 8
+    True
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._retired = _Shard()  # The counts of the threads that have ended
+        self._shards: List[_Shard] = [self._retired]
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def record(self, ns: int) -> None:
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._new_shard()
+
+        # _bucket_index, inlined
+        if ns < SUB_BUCKETS:
+            shard.counts[ns] += 1
+        else:
+            shift = ns.bit_length() - 1 - SUB_BUCKET_BITS
+            shard.counts[(shift + 1) * SUB_BUCKETS + ((ns >> shift) & 7)] += 1
+        shard.total += ns
+        if ns > shard.max:
+            shard.max = ns
+
+    def _new_shard(self) -> _Shard:
+        shard = self._local.shard = _Shard()
+        owner = self._local.owner = _ShardOwner()
+        finalizer = weakref.finalize(owner, _retire, weakref.ref(self), shard)
+        finalizer.atexit = False
+        with self._lock:
+            self._shards.append(shard)
+        return shard
+
+    def _retire(self, shard: _Shard) -> None:
+        with self._lock:
+            self._retired.merge(shard)
+            self._shards.remove(shard)
+
+    def reset(self) -> None:
+        with self._lock:
+            for shard in self._shards:
+                shard.counts = [0] * BUCKETS
+                shard.total = shard.max = 0
+
+    # ... Reading ...
+    def counts(self) -> List[int]:
+        """The bucket counts, merged across threads."""
+        # Under the lock, so a retiring shard isn't counted twice
+        with self._lock:
+            return list(map(sum, zip(*(shard.counts for shard in self._shards))))
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts())
+
+    @property
+    def total(self) -> int:
+        with self._lock:
+            return sum(shard.total for shard in self._shards)
+
+    @property
+    def max(self) -> int:
+        with self._lock:
+            return max((shard.max for shard in self._shards), default=0)
+
+    def percentile(self, percent: float, counts: Optional[List[int]] = None) -> int:
+        """
+        The duration `percent` of the recordings are at or under, in nanoseconds.
+        Returns 0 for an empty histogram.
+        """
+        if not 0 <= percent <= 100:
+            raise ValueError(f"percent must be between 0 and 100, not {percent}.")
+
+        counts = self.counts() if counts is None else counts
+        rank = max(1, -(-sum(counts) * percent // 100))
+
+        seen = 0
+        for index, count in enumerate(counts):
+            seen += count
+            if count and seen >= rank:
+                # The bucket's highest duration, so percentiles never under report
+                return min(_bucket_bounds(index)[1], self.max)
+        return 0
+
+    def summary(self) -> Dict[str, int]:
+        counts = self.counts()
+        return {
+            "count": sum(counts),
+            "total_ns": self.total,
+            "p50_ns": self.percentile(50, counts),
+            "p90_ns": self.percentile(90, counts),
+            "p99_ns": self.percentile(99, counts),
+            "max_ns": self.max,
+        }
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.name!r})"
+
+
+def _retire(histogram_ref: weakref.ref, shard: _Shard) -> None:
+    # A weak reference, so threads don't keep their histograms alive
+    histogram = histogram_ref()
+    if histogram is not None:
+        histogram._retire(shard)
+
+
+# ... Registry ...
+_histograms: Dict[str, LatencyHistogram] = {}
+_histograms_lock = threading.Lock()
+
+
+@export
+def get_histogram(name: str) -> LatencyHistogram:
+    """
+    Return the histogram recorded to under `name`, creating it if needed.
+    """
+    try:
+        return _histograms[name]
+    except KeyError:
+        with _histograms_lock:
+            return _histograms.setdefault(name, LatencyHistogram(name))
+
+
+@export
+def dump_histograms(file: Union[str, IO, None] = None, **json_kwargs: Any) -> str:
+    """
+    Dump the summary of every histogram as JSON, keyed by name.
+
+    Args:
+    ----
+        file (str | IO): A path or file to also write the JSON to. Defaults to None.
+        **json_kwargs: Passed to `json.dumps`, e.g. `indent=4`.
+
+    Returns:
+    -------
+        str: The JSON.
+    """
+    with _histograms_lock:
+        histograms = dict(_histograms)
+
+    dump = json.dumps(
+        {name: histogram.summary() for name, histogram in sorted(histograms.items())},
+        **json_kwargs,
+    )
+
+    if isinstance(file, str):
+        with open(file, "w") as f:
+            f.write(dump)
+    elif file is not None:
+        file.write(dump)
+    return dump
+
+
+@export
+def reset_histograms() -> None:
+    """Reset the counts of every histogram."""
+    with _histograms_lock:
+        histograms = list(_histograms.values())
+    for histogram in histograms:
+        histogram.reset()
+
+
+# ... Timing ...
+@export
+def timed(name: Union[str, Callable, None] = None) -> Any:
+    """
+    Record how long a function call, or a block of code, takes into the
+    histogram named `name`. Functions default to their qualified name.
+
+    Setting `timed.enabled = False` stops all recording.
+
+    Example:
+    -------
+    @timed
+    def parse(text): ...
+
+    @timed("db.query")
+    def query(sql): ...
+
+    with timed("render"):
+        ...
+
+    get_histogram("render").summary()
+    {'count': 1, 'total_ns': ..., 'p50_ns': ..., 'p90_ns': ..., 'p99_ns': ..., 'max_ns': ...}
+    """
+    # A timer per use, so blocks interleaved by coroutines keep their own start
+    if name.__class__ is str:
+        return _Timer(name, _histograms.get(name))
+
+    # @timed, rather than @timed() or @timed(name)
+    if callable(name):
+        return _Timer(None)(name)
+    return _Timer(name)
+
+
+# Global kill switch for `timed`
+timed.enabled = True
+
+
+class _Timer:
+    """
+    The decorator and context manager returned by `timed`. Each use of
+    `timed` gets its own timer, holding the starts of the blocks it's timing,
+    so blocks interleaved by coroutines on one thread don't share them.
+    """
+
+    __slots__ = ("name", "histogram", "starts")
+
+    def __init__(
+        self, name: Optional[str], histogram: Optional[LatencyHistogram] = None
+    ):
+        self.name = name
+        self.histogram = histogram or (None if name is None else get_histogram(name))
+        self.starts: List[Optional[int]] = []
+
+    def __call__(self, func: Callable) -> Callable:
+        histogram = self.histogram or get_histogram(
+            f"{func.__module__}.{func.__qualname__}"
+        )
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                if not timed.enabled:
+                    return await func(*args, **kwargs)
+
+                start = perf_counter_ns()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    histogram.record(perf_counter_ns() - start)
+
+        else:
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not timed.enabled:
+                    return func(*args, **kwargs)
+
+                start = perf_counter_ns()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    histogram.record(perf_counter_ns() - start)
+
+        wrapper.histogram = histogram
+        return wrapper
+
+    def __enter__(self) -> "_Timer":
+        if self.histogram is None:
+            raise TypeError("timed needs a name when used as a context manager.")
+
+        self.starts.append(perf_counter_ns() if timed.enabled else None)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        start = self.starts.pop()
+        if start is not None:
+            self.histogram.record(perf_counter_ns() - start)
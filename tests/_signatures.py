@@ -6,6 +6,10 @@ some_func and many_params can be seen as methods if used in this way, so we
 declare them here in a normal python file, so not to introduce bugs to the test suite.
 """
 
+from typing import Dict, List, Literal, Optional, Tuple
+
+from misc_utils import parallel_map
+
 
 def some_func(a, b, c):
     ...
@@ -42,6 +46,65 @@ def with_a_default(a, b, c=3):
     ...
 
 
+def mixed_defaults(a, /, b=2, *, c, d=4, **kwargs):
+    ...
+
+
+def add(a, b, *, c=0):
+    return a + b + c
+
+
+class Point:
+    def __init__(self, x, y=0, *, label=None):
+        self.x, self.y, self.label = x, y, label
+
+    def __eq__(self, other):
+        return (self.x, self.y, self.label) == (other.x, other.y, other.label)
+
+
+def annotated(
+    a: int,
+    b: Optional[str] = None,
+    *args: float,
+    flags: Tuple[bool, ...] = (),
+    mode: "Literal['r', 'w']" = "r",
+    **kwargs: List[int],
+):
+    return a
+
+
+# "Undefined" can't be resolved, which shouldn't stop `a` and `c` being checked
+def partly_annotated(a: int, b: "Undefined", c: "Optional[str]" = None):  # noqa: F821
+    return a
+
+
+def union_annotated(a: "int | None"):
+    return a
+
+
+class AnnotatedMethods:
+    def method(self, a: int, b: Dict[str, int]):
+        return a
+
+
+# parallel_map's process pools need importable functions
+@parallel_map(chunk_size=2, threshold=4)
+def squares(*values, offset=0):
+    return [value * value + offset for value in values]
+
+
+@parallel_map("values", executor="thread", threshold=4, merge=sum)
+def total(scale, values):
+    return sum(value * scale for value in values)
+
+
+@parallel_map(chunk_size=1, threshold=2)
+def worker_pids(*values):
+    import os
+
+    return [(os.getpid(), squares(*range(10))) for _ in values]
+
+
 if __name__ == "__main__":
     import inspect
 
@@ -1,10 +1,34 @@
 import pytest
 
+import functools
 from pathlib import Path
 import sys
 import importlib.util
 
-from misc_utils import selfie
+from misc_utils import (
+    selfie,
+    validate_annotations,
+    memoize,
+    disk_memoize,
+    single_flight,
+    micro_batch,
+    parallel_map,
+    apply_decorators,
+)
+
+# Import from the tests/_signatures.py file
+sys.path.append(str(Path(__file__).parent))
+from _signatures import (
+    some_func,
+    annotated,
+    partly_annotated,
+    union_annotated,
+    AnnotatedMethods,
+    squares,
+    total,
+    worker_pids,
+)
+
 
 def test_selfie():
     class TestClass:
@@ -25,6 +49,637 @@ def test_selfie():
     assert (obj.a, obj.b, obj.c) == (1, 2, 3)
 
 
+def test_selfie_defaults_and_variadics():
+    class TestClass:
+        @selfie("ignored")
+        def __init__(self, a, /, b=2, *args, c, ignored=None, **kwargs):
+            self.init_args = (a, b, args, c, ignored, kwargs)
+
+    obj = TestClass(1, c=3, d=4)
+    assert (obj.a, obj.b, obj.args, obj.c, obj.kwargs) == (1, 2, (), 3, {"d": 4})
+    assert not hasattr(obj, "ignored")
+    assert obj.init_args == (1, 2, (), 3, None, {"d": 4})
+
+    # Invalid calls name the method, as they would without @selfie
+    with pytest.raises(TypeError, match=r"__init__\(\) missing 1 required keyword"):
+        TestClass(1)
+
+
+def test_selfie_slots():
+    class TestClass:
+        __slots__ = ("a", "b")
+
+        @selfie("c")
+        def __init__(self, a, b, c):
+            ...
+
+    obj = TestClass(1, 2, 3)
+    assert (obj.a, obj.b) == (1, 2)
+
+    class NoSlotForC(TestClass):
+        __slots__ = ()
+
+        @selfie
+        def __init__(self, a, b, c):
+            ...
+
+    with pytest.raises(AttributeError):
+        NoSlotForC(1, 2, 3)
+
+
+def test_validate_annotations():
+    validated = validate_annotations(annotated)
+    assert validated(1) == 1
+    assert validated(1, "b", 2.0, 3, flags=(True,), mode="w", extra=[1, 2]) == 1
+    assert validated(1, None) == 1
+
+    for args, kwargs in [
+        (("1",), {}),
+        ((1, 2), {}),
+        ((1, None, "2.0"), {}),
+        ((1,), {"flags": (True, 1)}),
+        ((1,), {"flags": [True]}),
+        ((1,), {"mode": "x"}),
+        ((1,), {"extra": [1, "2"]}),
+    ]:
+        with pytest.raises(TypeError):
+            validated(*args, **kwargs)
+
+    method = validate_annotations(AnnotatedMethods.method)
+    assert method(AnnotatedMethods(), 1, {"a": 1}) == 1
+    with pytest.raises(TypeError, match="`b`"):
+        method(AnnotatedMethods(), 1, {"a": "1"})
+
+
+def test_validate_annotations_unresolvable():
+    validated = validate_annotations(partly_annotated)
+    assert validated(1, object()) == 1
+    with pytest.raises(TypeError, match="`a`"):
+        validated("1", object())
+    with pytest.raises(TypeError, match="`c`"):
+        validated(1, object(), 2)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="PEP 604 unions need 3.10")
+def test_validate_annotations_union():
+    validated = validate_annotations(union_annotated)
+    assert validated(1) == 1
+    assert validated(None) is None
+    with pytest.raises(TypeError):
+        validated("1")
+
+
+def test_validate_annotations_sampling():
+    validated = validate_annotations(sample_every=2)(annotated)
+    with pytest.raises(TypeError):
+        validated("checked")
+    assert validated("skipped") == "skipped"
+    with pytest.raises(TypeError):
+        validated("checked")
+
+    validated = validate_annotations(annotated)
+    validate_annotations.enabled = False
+    try:
+        assert validated("unchecked") == "unchecked"
+    finally:
+        validate_annotations.enabled = True
+
+
+def test_memoize():
+    calls = []
+
+    @memoize
+    def power(base, exp=2, **kwargs):
+        calls.append((base, exp, kwargs))
+        return base**exp
+
+    assert power(3) == power(3, 2) == power(base=3, exp=2) == 9
+    assert power(3, x=1, y=2) == power(3, y=2, x=1) == 9
+    assert calls == [(3, 2, {}), (3, 2, {"x": 1, "y": 2})]
+    assert power.cache_info() == {
+        "hits": 3, "misses": 2, "evictions": 0, "size": 2, "bytes": 0
+    }
+
+    # Unhashable arguments aren't cached
+    assert power(3, unhashable=[]) == 9
+    assert power(3, unhashable=[]) == 9
+    assert len(calls) == 4 and power.cache_info()["size"] == 2
+
+    power.cache_clear()
+    assert power.cache_info() == {
+        "hits": 0, "misses": 0, "evictions": 0, "size": 0, "bytes": 0
+    }
+
+    with pytest.raises(TypeError):
+        power()
+
+
+def test_memoize_ignore_parameters():
+    @memoize("verbose")
+    def double(x, verbose=False):
+        return [x * 2, verbose]
+
+    assert double(1) is double(1, verbose=True)
+
+    with pytest.raises(ValueError):
+        memoize("missing")(lambda x: x)
+
+
+@pytest.mark.parametrize(
+    "policy, expected",
+    [("lru", {1, 3}), ("lfu", {1, 3}), ("ttl", {2, 3})],
+)
+def test_memoize_policies(policy, expected):
+    @memoize(policy=policy, maxsize=2, ttl=60)
+    def identity(x):
+        return x
+
+    identity(1), identity(2), identity(1)  # 1 is the most recent, and most used
+    identity(3)  # evicts 2 ("lru", "lfu"), or 1 ("ttl", the oldest)
+    assert identity.cache_info()["evictions"] == 1
+
+    misses = identity.cache_info()["misses"]
+    for x in expected:
+        identity(x)
+    assert identity.cache_info()["misses"] == misses
+
+
+def test_memoize_lfu_frequency():
+    @memoize(policy="lfu", maxsize=2)
+    def identity(x):
+        return x
+
+    for x in (1, 1, 1, 2, 2, 3):  # 3 evicts 2, the least used
+        identity(x)
+    identity(4)  # evicts 3, as 1 has been used more
+
+    hits = identity.cache_info()["hits"]
+    identity(1), identity(4)
+    assert identity.cache_info()["hits"] == hits + 2
+
+
+def test_memoize_ttl(monkeypatch):
+    import misc_utils.decorator_utils as decorator_utils
+
+    now = [0.0]
+    monkeypatch.setattr(decorator_utils.time, "monotonic", lambda: now[0])
+
+    @memoize(policy="ttl", ttl=10)
+    def identity(x):
+        return x
+
+    identity(1), identity(1)
+    now[0] = 10.0
+    identity(1)
+    assert identity.cache_info() == {
+        "hits": 1, "misses": 2, "evictions": 1, "size": 1, "bytes": 0
+    }
+
+    with pytest.raises(ValueError):
+        memoize(policy="ttl")
+
+
+def test_memoize_max_bytes():
+    import sys
+
+    @memoize(maxsize=None, max_bytes=3 * sys.getsizeof("x" * 100))
+    def text(n):
+        return "x" * n
+
+    for n in range(100, 105):
+        text(n)
+    info = text.cache_info()
+    assert info["size"] < 5 and info["evictions"] == 5 - info["size"]
+    assert info["bytes"] <= 3 * sys.getsizeof("x" * 100)
+
+    text(10**6)  # larger than the budget, never cached
+    assert text.cache_info()["size"] == info["size"]
+
+
+def test_memoize_max_bytes_containers():
+    # The strings inside a result count toward max_bytes, not just the list
+    @memoize(maxsize=None, max_bytes=2_500_000)
+    def lines(n):
+        return [str(n) * 1_000_000]
+
+    for n in range(1, 6):
+        lines(n)
+    assert lines.cache_info()["size"] == 2
+    assert lines.cache_info()["bytes"] > 2_000_000
+
+    @memoize(maxsize=None, max_bytes=10, sizeof=len)
+    def letters(n):
+        return "x" * n
+
+    for n in (4, 4, 5, 6):
+        letters(n)
+    assert letters.cache_info()["size"] == 1 and letters.cache_info()["bytes"] == 6
+
+
+def test_disk_memoize(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    calls = []
+
+    def power(base, exp=2, **kwargs):
+        calls.append((base, exp))
+        return base**exp
+
+    cached = disk_memoize(path=path)(power)
+    assert cached(3) == cached(3, 2) == cached(base=3, exp=2) == 9
+    assert calls == [(3, 2)]
+
+    # Results outlive the decorated function, e.g. across restarts
+    assert disk_memoize(path=path)(power)(3) == 9
+    assert calls == [(3, 2)]
+    assert cached.cache_info() == {
+        "hits": 2, "misses": 1, "evictions": 0, "size": 1, "bytes": 5
+    }
+
+    # The version is part of the key
+    assert disk_memoize(path=path, version="2")(power)(3) == 9
+    assert len(calls) == 2
+
+    # Unpicklable arguments aren't cached
+    assert cached(3, key=lambda: None) == 9
+    assert cached(3, key=lambda: None) == 9
+    assert len(calls) == 4
+
+    cached.cache_clear()
+    assert cached.cache_info()["size"] == 0
+
+
+def test_disk_memoize_eviction(tmp_path, monkeypatch):
+    import random
+    from misc_utils.decorator_utils import _DiskStore
+
+    path = str(tmp_path / "cache.sqlite3")
+    monkeypatch.setattr(_DiskStore, "ACCESS_INTERVAL", 0)  # Exact LRU order
+
+    @disk_memoize(path=path, max_bytes=3000)
+    def noise(n):
+        return random.Random(n).randbytes(1000)
+
+    for n in range(5):
+        noise(n)
+    info = noise.cache_info()
+    assert info["evictions"] == 3 and info["size"] == 2 and info["bytes"] <= 3000
+
+    noise(3)  # 3 is used more recently than 4, so 4 is evicted next
+    noise(5)
+    misses = noise.cache_info()["misses"]
+    assert noise(3) == random.Random(3).randbytes(1000)
+    assert noise.cache_info()["misses"] == misses
+
+    # Compressed, every result fits the budget
+    @disk_memoize(path=path, max_bytes=3000, compress=True)
+    def text(n):
+        return str(n) * 1000
+
+    for n in range(5):
+        text(n)
+    assert text.cache_info()["size"] == 5
+    assert text(4) == "4" * 1000
+
+    # Larger than the budget, never stored
+    @disk_memoize(path=path, max_bytes=3000)
+    def zeros(n):
+        return bytes(n)
+
+    assert zeros(5000) == bytes(5000)
+    assert zeros.cache_info()["size"] == 0
+
+
+def test_disk_memoize_hits_dont_write(tmp_path):
+    import sqlite3
+
+    path = str(tmp_path / "cache.sqlite3")
+
+    @disk_memoize(path=path)
+    def square(x):
+        return x * x
+
+    def accessed():
+        with sqlite3.connect(path) as connection:
+            return connection.execute("SELECT accessed FROM entries").fetchone()[0]
+
+    square(3)
+    stored = accessed()
+    assert square(3) == 9
+    assert accessed() == stored  # Within ACCESS_INTERVAL of being stored
+
+
+def test_disk_memoize_threads(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    @disk_memoize(path=str(tmp_path / "cache.sqlite3"), max_bytes=None)
+    def square(x):
+        return x * x
+
+    with ThreadPoolExecutor(8) as pool:
+        assert list(pool.map(square, list(range(50)) * 4)) == [x * x for x in range(50)] * 4
+    assert square.cache_info()["size"] == 50
+
+
+def test_single_flight():
+    import asyncio
+
+    calls = []
+
+    @single_flight
+    async def fetch(url, timeout=10):
+        calls.append(url)
+        await asyncio.sleep(0.01)
+        return url.upper()
+
+    async def main():
+        results = await asyncio.gather(
+            fetch("a"), fetch("a", 10), fetch(url="a"), fetch("b")
+        )
+        assert results == ["A", "A", "A", "B"]
+        assert calls == ["a", "b"]
+
+        # Nothing is cached without a ttl
+        assert await fetch("a") == "A"
+        assert calls == ["a", "b", "a"]
+
+    asyncio.run(main())
+    assert fetch.flight_info() == {
+        "leaders": 3, "coalesced": 2, "hits": 0, "cancelled": 0, "in_flight": 0
+    }
+
+    with pytest.raises(TypeError):
+        single_flight(lambda: None)
+
+
+def test_single_flight_cancellation():
+    import asyncio
+
+    @single_flight
+    async def slow(x):
+        await asyncio.sleep(0.05)
+        return x
+
+    async def main():
+        first = asyncio.ensure_future(slow(1))
+        second = asyncio.ensure_future(slow(1))
+        await asyncio.sleep(0)
+
+        # Cancelling one caller doesn't cancel the shared call
+        first.cancel()
+        assert await second == 1
+        assert first.cancelled()
+
+        # Cancelling every caller cancels the shared call
+        third = asyncio.ensure_future(slow(2))
+        await asyncio.sleep(0)
+        third.cancel()
+        await asyncio.sleep(0)
+        assert slow.flight_info()["in_flight"] == 0
+        assert await slow(2) == 2
+
+    asyncio.run(main())
+    assert slow.flight_info()["cancelled"] == 2
+
+
+def test_single_flight_ttl():
+    import asyncio
+
+    calls = []
+
+    @single_flight(ttl=60)
+    async def fetch(url):
+        calls.append(url)
+        await asyncio.sleep(0)
+        if url == "bad":
+            raise ValueError(url)
+        return url
+
+    async def main():
+        assert await fetch("a") == await fetch("a") == "a"
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                await fetch("bad")
+
+    asyncio.run(main())
+    assert calls == ["a", "bad", "bad"]  # exceptions aren't cached
+    assert fetch.flight_info()["hits"] == 1
+
+    fetch.cache_clear()
+    asyncio.run(fetch("a"))
+    assert calls[-1] == "a"
+
+
+def test_micro_batch():
+    from concurrent.futures import ThreadPoolExecutor
+
+    batches = []
+
+    @micro_batch("keys", max_batch_size=4, max_wait=0.05)
+    def lookup(prefix, keys, suffix=""):
+        batches.append((prefix, list(keys)))
+        return [f"{prefix}{key}{suffix}" for key in keys]
+
+    with ThreadPoolExecutor(8) as pool:
+        futures = [pool.submit(lookup, "a", key) for key in range(8)]
+        futures.append(pool.submit(lookup, "b", keys=0, suffix="!"))
+        results = [future.result() for future in futures]
+
+    assert results == [f"a{key}" for key in range(8)] + ["b0!"]
+    assert sorted(len(keys) for prefix, keys in batches if prefix == "a") == [4, 4]
+    assert ("b", [0]) in batches
+
+    info = lookup.batch_info()
+    assert (info["batches"], info["items"]) == (3, 9)
+    assert info["batch_sizes"][1] == 1 and info["batch_sizes"][4] == 2
+    assert info["latency_ns"]["count"] == 9
+    assert 0 < info["latency_ns"]["p50_ns"] <= info["latency_ns"]["max_ns"]
+
+
+def test_micro_batch_errors():
+    @micro_batch
+    def double(values):
+        if 0 in values:
+            raise ZeroDivisionError
+        return [value * 2 for value in values]
+
+    assert double(1) == 2
+
+    with pytest.raises(ZeroDivisionError):
+        double(0)
+
+    with pytest.raises(TypeError):
+        double()
+
+    # A result for each item
+    with pytest.raises(ValueError):
+        micro_batch(lambda values: [])(1)
+
+    with pytest.raises(ValueError):
+        micro_batch("missing")(lambda values: values)
+
+
+def test_micro_batch_async():
+    import asyncio
+
+    batches = []
+
+    @micro_batch(max_batch_size=3, max_wait=0.01)
+    async def square(values):
+        batches.append(list(values))
+        await asyncio.sleep(0)
+        return [value**2 for value in values]
+
+    async def main():
+        return await asyncio.gather(*(square(value) for value in range(5)))
+
+    assert asyncio.run(main()) == [0, 1, 4, 9, 16]
+    assert batches == [[0, 1, 2], [3, 4]]
+
+
+def test_micro_batch_no_threads():
+    import threading
+
+    @micro_batch(max_wait=0.001)
+    def double(values):
+        return [value * 2 for value in values]
+
+    threads = threading.active_count()
+    assert [double(value) for value in range(50)] == [value * 2 for value in range(50)]
+    assert double.batch_info()["batches"] == 50
+    assert threading.active_count() == threads  # The first caller dispatches
+
+
+def test_micro_batch_slow_batches():
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    @micro_batch("values", max_wait=0.01)
+    def slow(values, key):
+        time.sleep(0.3)
+        return list(values)
+
+    def timed_call(key):
+        start = time.perf_counter()
+        assert slow(key, key=key) == key
+        return time.perf_counter() - start
+
+    # Batches of different keys are dispatched side by side, not one after another
+    with ThreadPoolExecutor(4) as pool:
+        latencies = list(pool.map(timed_call, range(4)))
+    assert max(latencies) < 0.5
+
+    # The bulk function can call itself
+    @micro_batch(max_wait=0.001)
+    def nested(values):
+        return [nested(value - 1) if value else 0 for value in values]
+
+    assert nested(3) == 0
+
+
+def test_parallel_map():
+    import os
+
+    assert squares(*range(10), offset=1) == [value * value + 1 for value in range(10)]
+    assert squares(1, 2) == [1, 4]  # under the threshold
+    assert squares() == []
+
+    assert total(2, range(10)) == total(2, values=list(range(10))) == 90
+    assert total(2, [1]) == 2
+
+    # Workers run nested calls serially, rather than fanning out again
+    pids = worker_pids(1, 2, 3)
+    assert all(result == squares(*range(10)) for pid, result in pids)
+    assert os.getpid() not in {pid for pid, result in pids}
+
+    with pytest.raises(ValueError):
+        parallel_map(lambda values: values)
+    with pytest.raises(ValueError):
+        parallel_map(executor="fiber")
+
+
+def test_shared_executor():
+    from misc_utils.decorator_utils import _shared_executor
+
+    pool, workers = _shared_executor("thread", 3)
+    assert workers == 3 and _shared_executor("thread", 3)[0] is pool
+
+    pool, workers = _shared_executor("thread", None)
+    assert workers >= 5  # the executor's default, cpu_count() + 4
+
+
+def test_apply_decorators_fuse():
+    class Point:
+        def __init__(self, x: int, y: int = 0, *, label: str = ""):
+            self.init_args = (x, y, label)
+
+    init = Point.__init__
+    Point.__init__ = apply_decorators(
+        init, validate_annotations, selfie("label"), fuse=True
+    )
+    assert Point.__init__.__wrapped__ is init  # one wrapper for both decorators
+
+    point = Point(1, label="a")
+    assert (point.x, point.y, point.init_args) == (1, 0, (1, 0, "a"))
+    assert not hasattr(point, "label")
+
+    with pytest.raises(TypeError, match="`y`"):
+        Point(1, "2")
+
+
+def test_apply_decorators_fuse_closure():
+    # A nested function's qualname is dotted, but it doesn't take `self`
+    def func(x: int, y=0):
+        return x, y
+
+    fused = apply_decorators(func, validate_annotations, fuse=True)
+    assert fused(1) == (1, 0)
+    with pytest.raises(TypeError, match="`x`"):
+        fused("not an int")
+
+
+def test_apply_decorators_fuse_runs():
+    calls = []
+
+    def record(name):
+        def hook(mutator):
+            calls.append((name, mutator.asdict()["a"]))
+
+        def decorator(func):
+            def wrapper(*args, **kwargs):
+                calls.append((name, args[0]))
+                return func(*args, **kwargs)
+
+            return wrapper
+
+        decorator.__fuse__ = lambda func: hook
+        return decorator
+
+    def double(mutator):
+        mutator["a"] = mutator.asdict()["a"] * 2
+
+    def plain(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            calls.append(("plain", args[0]))
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    doubling = lambda func: func  # noqa: E731
+    doubling.__fuse__ = lambda func: double
+
+    decorated = apply_decorators(
+        some_func, record("outer"), doubling, plain, record("inner"), fuse=True
+    )
+    assert decorated(1, 2, 3) is None
+    assert calls == [("outer", 1), ("plain", 2), ("inner", 2)]
+
+    # Without fusing, the decorators are applied as usual
+    calls.clear()
+    apply_decorators(some_func, record("outer"), plain)(1, 2, 3)
+    assert calls == [("outer", 1), ("plain", 1)]
+
+
 @pytest.mark.parametrize(
     "module_name, contains", [("not_in__all__.py", False), ("in__all__.py", True)]
 )
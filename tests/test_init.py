@@ -0,0 +1,83 @@
+import pytest
+
+import importlib
+from pathlib import Path
+import subprocess
+import sys
+
+import misc_utils
+
+# Cumulative import time of `import misc_utils`, in microseconds
+STARTUP_BUDGET_US = 50_000
+
+
+def run_python(code: str, *options: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_exported_names():
+    # The table matches what the submodules export when imported
+    expected = {"export": "decorator_utils"}
+    for module_name in misc_utils._MODULES:
+        module = importlib.import_module(f"misc_utils.{module_name}")
+        expected.update(dict.fromkeys(module.__all__, module_name))
+
+    assert misc_utils._exported_names == expected
+    assert sorted(misc_utils.__all__) == sorted(expected)
+    assert set(expected) <= set(dir(misc_utils))
+
+
+def test_lazy_attributes():
+    from misc_utils.iterable_utils import flatten
+
+    assert misc_utils.flatten is flatten
+    assert "flatten" in vars(misc_utils)  # resolved once
+
+    with pytest.raises(AttributeError):
+        misc_utils.not_a_name
+    with pytest.raises(AttributeError):
+        misc_utils.media_utils  # Not one of the package's submodules
+    with pytest.raises(ImportError):
+        from misc_utils import not_a_name  # noqa: F401
+
+
+def test_submodule_attributes():
+    result = run_python(
+        "import misc_utils\n"
+        "print(misc_utils.param_utils.__name__, misc_utils.param_utils.ArgMutator is misc_utils.ArgMutator)"
+    )
+    assert result.stdout.split() == ["misc_utils.param_utils", "True"]
+
+
+def test_lazy_import():
+    result = run_python(
+        "import sys, misc_utils\n"
+        "from misc_utils import flatten\n"
+        "print(sorted({'dateparser', 'pendulum', 'misc_utils.datetime_utils'} & set(sys.modules)))"
+    )
+    assert result.stdout.strip() == "[]"
+
+    # Star imports still import everything
+    result = run_python(
+        "from misc_utils import *\n"
+        "print(callable(flatten), callable(ArgMutator), 'pendulum' in dir())"
+    )
+    assert result.stdout.split() == ["True", "True", "False"]
+
+
+def test_startup_budget():
+    result = run_python("import misc_utils", "-X", "importtime")
+
+    # import time: self [us] | cumulative | imported package
+    cumulative = next(
+        int(line.split("|")[1])
+        for line in result.stderr.splitlines()
+        if line.split("|")[-1].strip() == "misc_utils"
+    )
+    assert cumulative < STARTUP_BUDGET_US
@@ -1,10 +1,16 @@
 import pytest
+import mmap
+import pickle
+
 from misc_utils import (
+    AhoCorasick,
     arg_to_iter,
     chunk_iter,
     all_indicies,
+    iter_indices,
     sort_list_by_key,
     flatten,
+    iflatten,
     sort_list_by_attr,
 )
 
@@ -29,6 +35,99 @@ def test_chunk_iter():
     assert chunk_iter(some_list, 2) == ([1, 2], [3, 4], [5, 6], [7, 8], [9, 10])
     assert chunk_iter(some_list, 3) == ([1, 2, 3], [4, 5, 6], [7, 8, 9], [10])
 
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({}, ((0, 1, 2), (3, 4, 5), (6,))),
+        ({"drop_last": True}, ((0, 1, 2), (3, 4, 5))),
+        ({"pad": True}, ((0, 1, 2), (3, 4, 5), (6, None, None))),
+        ({"pad": True, "fillvalue": -1}, ((0, 1, 2), (3, 4, 5), (6, -1, -1))),
+    ],
+)
+def test_chunk_iter_iterators(kwargs, expected):
+    assert chunk_iter((x for x in range(7)), 3, **kwargs) == expected
+
+    chunks = chunk_iter(iter(range(7)), 3, lazy=True, **kwargs)
+    assert not isinstance(chunks, tuple)
+    assert tuple(chunks) == expected
+
+    # Sequences keep their type
+    assert chunk_iter(list(range(7)), 3, **kwargs) == tuple(map(list, expected))
+
+
+def test_chunk_iter_buffers():
+    import mmap
+
+    data = bytearray(b"abcdefg")
+    chunks = list(chunk_iter(data, 3, lazy=True))
+    assert all(isinstance(chunk, memoryview) for chunk in chunks)
+    assert [bytes(chunk) for chunk in chunks] == [b"abc", b"def", b"g"]
+
+    data[0:1] = b"z"  # views, not copies
+    assert bytes(chunks[0]) == b"zbc"
+
+    assert chunk_iter(b"abcdefg", 3) == (b"abc", b"def", b"g")
+    assert list(chunk_iter(b"abcdefg", 3, lazy=True, pad=True))[-1] == b"g\x00\x00"
+    for fillvalue in (b"-", bytearray(b"-"), ord("-")):
+        assert chunk_iter(b"abcde", 2, pad=True, fillvalue=fillvalue)[-1] == b"e-"
+    for fillvalue in (b"--", "-", 256):
+        with pytest.raises(ValueError):
+            chunk_iter(b"abcde", 2, pad=True, fillvalue=fillvalue)
+    assert chunk_iter("abcdefg", 3, pad=True, fillvalue="-") == ("abc", "def", "g--")
+    for lazy in (False, True):  # Not a string fillvalue, padded as a tuple
+        assert tuple(chunk_iter("abcde", 2, lazy=lazy, pad=True)) == (
+            "ab",
+            "cd",
+            ("e", None),
+        )
+
+    with mmap.mmap(-1, 7) as buffer:
+        buffer.write(b"abcdefg")
+        chunks = chunk_iter(buffer, 3, lazy=True, drop_last=True)
+        assert [bytes(chunk) for chunk in chunks] == [b"abc", b"def"]
+
+
+def test_chunk_iter_arrays():
+    import numpy as np
+
+    array = np.arange(14).reshape(7, 2)
+    chunks = list(chunk_iter(array, 3, lazy=True))
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    assert all(np.shares_memory(chunk, array) for chunk in chunks)
+
+    padded = chunk_iter(array, 3, pad=True)[-1]
+    assert padded.tolist() == [[12, 13], [0, 0], [0, 0]]
+
+
+def test_chunk_iter_sliceable():
+    class Frame:
+        """Sized and sliceable, but not a registered Sequence, iterates over columns."""
+
+        def __init__(self, rows):
+            self.rows = rows
+
+        def __len__(self):
+            return len(self.rows)
+
+        def __getitem__(self, index):
+            return Frame(self.rows[index])
+
+        def __iter__(self):
+            return iter(("colA", "colB"))
+
+    chunks = chunk_iter(Frame([1, 2, 3]), 2)
+    assert [chunk.rows for chunk in chunks] == [[1, 2], [3]]
+
+    assert chunk_iter({"a": 1, "b": 2}, 1) == (("a",), ("b",))  # Keys, not slices
+
+
+def test_chunk_iter_errors():
+    with pytest.raises(ValueError):
+        chunk_iter([1, 2], 0)
+    with pytest.raises(ValueError):
+        chunk_iter([1, 2], 1, drop_last=True, pad=True)
+
 @pytest.mark.parametrize(
     "nested_list, expected",
     [
@@ -42,12 +141,66 @@ def test_flatten(nested_list, expected):
     assert list(flatten(nested_list)) == expected
 
 
+def test_iflatten_deep_nesting():
+    nested = [0]
+    for i in range(1, 10_000):
+        nested = [nested, i]
+    assert flatten(nested) == list(range(10_000))
+
+
+@pytest.mark.parametrize(
+    "max_depth, expected",
+    [
+        (0, [1, [2, [3, [4]]]]),
+        (1, [1, 2, [3, [4]]]),
+        (2, [1, 2, 3, [4]]),
+        (None, [1, 2, 3, 4]),
+    ],
+)
+def test_iflatten_max_depth(max_depth, expected):
+    assert list(iflatten([1, [2, [3, [4]]]], max_depth)) == expected
+    assert flatten([1, [2, [3, [4]]]], max_depth=max_depth) == expected
+
+
+def test_iflatten_cycles():
+    a = [1]
+    a.append(a)
+    with pytest.raises(ValueError):
+        flatten(a)
+
+    b = [2, [a]]
+    with pytest.raises(ValueError):
+        list(iflatten([0, b]))
+
+    # Repeated, but not nested in itself
+    shared = [1, 2]
+    assert flatten([shared, [shared]]) == [1, 2, 1, 2]
+    assert flatten(a, max_depth=0) == [1, a]
+
+
+def test_iflatten_streams():
+    def rows():
+        for i in range(3):
+            yield [i, (str(i), b"x")]
+        raise AssertionError("consumed past what was needed")
+
+    flat = iflatten(rows())
+    assert [next(flat) for _ in range(6)] == [0, "0", b"x", 1, "1", b"x"]
+    assert list(iflatten([{"a": 1}, range(2), "ab"])) == ["a", 0, 1, "ab"]
+
+
 @pytest.mark.parametrize(
     "iterable, obj, expected",
     [
         ("hello world hello world", "world", (6, 18)),
         ([1, 2, 3, 4, 1, 5, 1], 1, (0, 4, 6)),
         ("apple", "p", (1, 2)),
+        ("aaaa", "aa", (0, 1, 2)),  # Overlapping
+        (b"a\x00b\x00", b"\x00", (1, 3)),
+        (bytearray(b"abab"), b"b", (1, 3)),
+        ((None, 0, None), None, (0, 2)),
+        ((x % 3 for x in range(7)), 0, (0, 3, 6)),  # Any iterable
+        ({"a": 1, "b": 2}, "b", (1,)),
     ],
 )
 def test_all_indicies(iterable, obj, expected):
@@ -61,6 +214,71 @@ def test_all_indices_errors():
     with pytest.raises(ValueError):
         all_indicies("hello", "z")
 
+    with pytest.raises(ValueError):
+        all_indicies([1, 2, 3], 4)
+
+
+def test_all_indicies_numpy():
+    np = pytest.importorskip("numpy")
+    assert all_indicies(np.array([3, 1, 3, 3]), 3) == (0, 2, 3)
+    assert all_indicies(np.array([[1, 0], [0, 1]]), 1) == (0, 3)  # Flat indices
+
+
+def test_iter_indices():
+    indices = iter_indices("ab" * 1000, "b")
+    assert next(indices) == 1
+    assert next(indices) == 3
+
+    with pytest.raises(AttributeError):
+        iter_indices(42, 42)  # Raised on the call, not the first next()
+
+
+def test_aho_corasick():
+    keywords = ["an", "ana", "nan", "banana", "x"]
+    text = "bananas and a nana"
+
+    automaton = AhoCorasick(keywords)
+    assert automaton.findall(text) == {
+        keyword: tuple(iter_indices(text, keyword)) for keyword in keywords
+    }
+    assert automaton.findall(text)["an"] == all_indicies(text, "an")
+    assert automaton.findall(text)["x"] == ()
+
+    leftmost_longest = AhoCorasick(keywords, "leftmost_longest")
+    assert list(leftmost_longest.finditer(text)) == [
+        (0, "banana"),
+        (8, "an"),
+        (14, "nan"),
+    ]
+
+    # Reusable after a round trip through pickle
+    assert pickle.loads(pickle.dumps(leftmost_longest)).findall(
+        "banana"
+    ) == leftmost_longest.findall("banana")
+
+
+def test_aho_corasick_bytes(tmp_path):
+    automaton = AhoCorasick([b"\x00\x01", b"\x01"])
+    assert automaton.findall(b"\x00\x01\x01") == {b"\x00\x01": (0,), b"\x01": (1, 2)}
+
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"ab\x00\x01" * 3)
+    with open(path, "rb") as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped:
+        assert automaton.findall(mapped)[b"\x01"] == (3, 7, 11)
+
+
+def test_aho_corasick_errors():
+    with pytest.raises(TypeError):
+        AhoCorasick(["a", b"b"])
+    with pytest.raises(TypeError):
+        AhoCorasick(["a"]).findall(b"a")
+    with pytest.raises(ValueError):
+        AhoCorasick(["a", ""])
+    with pytest.raises(ValueError):
+        AhoCorasick(["a"], mode="shortest")
+
 
 @pytest.mark.parametrize(
     "lst, key, reverse, expected",
@@ -1,6 +1,14 @@
 import pytest
 
-from misc_utils import json_dump, json_load, rmdir_non_empty, reprint, ordinal
+from misc_utils import (
+    json_dump,
+    json_load,
+    rmdir_non_empty,
+    reprint,
+    ordinal,
+    search_file,
+    iter_indices,
+)
 
 
 def test_json_functions(tmp_path):
@@ -48,6 +56,35 @@ def test_ordinal(n, expected):
     assert ordinal(n) == expected
 
 
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_search_file(tmp_path, executor):
+    data = b"".join(b"%d,abab;" % i for i in range(5000))
+    path = tmp_path / "dump.bin"
+    path.write_bytes(data)
+
+    expected = tuple(iter_indices(data, b"bab"))
+    # Small chunks, so matches span the chunk boundaries
+    assert search_file(path, b"bab", chunk_size=1000, executor=executor) == expected
+    assert search_file(str(path), "4999,", chunk_size=7, executor=executor) == (
+        data.index(b"4999,"),
+    )
+    assert search_file(path, b"zz", chunk_size=1000, executor=executor) == ()
+
+
+def test_search_file_serial(tmp_path):
+    path = tmp_path / "small.txt"
+    path.write_bytes(b"aaaa")
+    assert search_file(path, b"aa") == (0, 1, 2)  # One chunk, searched serially
+
+    path.write_bytes(b"")
+    assert search_file(path, b"a") == ()
+
+    with pytest.raises(ValueError):
+        search_file(path, b"")
+    with pytest.raises(ValueError):
+        search_file(path, b"a", chunk_size=0)
+
+
 if __name__ == "__main__":
     from pathlib import Path
     from pprint import pprint
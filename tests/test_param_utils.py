@@ -2,19 +2,32 @@ import pytest
 from misc_utils import (
     Param,
     ParamProbe,
+    SignatureCache,
     ArgMutator,
     bind_args,
     missing_args,
+    missing_args_many,
     build_signature,
     mapping_to_kwargs,
+    RecordLoader,
 )
 
 from pathlib import Path
 import sys
+import gc
 
 # Import from the tests/_signatures.py file
 sys.path.append(str(Path(__file__).parent))
-from _signatures import some_func, many_params, SomeClass, some_instance, with_a_default
+from _signatures import (
+    some_func,
+    many_params,
+    SomeClass,
+    some_instance,
+    with_a_default,
+    mixed_defaults,
+    add,
+    Point,
+)
 
 
 class TestParamProbe:
@@ -151,6 +164,29 @@ class TestParamProbe:
                 "var_kw_param",
             )
 
+    def test_param(self, probe):
+        param = probe["pos_only_param"]
+        assert param.kind == "POSITIONAL_ONLY"
+        assert param.is_pos_only and param.can_pass_pos_arg
+        assert not param.can_pass_kw_arg
+        assert not hasattr(param, "__dict__")
+
+    def test_kind_index_is_shared(self):
+        first, second = ParamProbe(many_params), ParamProbe(many_params)
+        assert first["ALL_POSITIONAL"] is second["ALL_POSITIONAL"]
+        assert first.parameters is second.parameters
+
+        # Deleting rebuilds the index of that probe only
+        del first["VAR_POSITIONAL"]
+        assert first.names == (
+            "pos_only_param",
+            "pos_or_kw_param",
+            "kw_only_param",
+            "var_kw_param",
+        )
+        assert first.get_count("ALL_POSITIONAL") == 2
+        assert second.get_count("ALL_POSITIONAL") == 3
+
     def test__getitem__(self, probe):
         assert probe["pos_only_param"].name == "pos_only_param"
 
@@ -195,6 +231,73 @@ class TestParamProbe:
         )
 
 
+class TestSignatureCache:
+    def test_hits_and_misses(self):
+        def func(a, b=2): ...
+
+        info = ParamProbe.cache.info()
+        ParamProbe(func)
+        ParamProbe(func)
+
+        assert ParamProbe.cache.hits - info["hits"] == 1
+        assert ParamProbe.cache.misses - info["misses"] == 1
+        assert func in ParamProbe.cache
+
+    def test_remove_self_variants(self):
+        class Klass:
+            def method(self, x): ...
+
+        misses = ParamProbe.cache.misses
+        assert ParamProbe(Klass.method).names == ("self", "x")
+        assert ParamProbe(Klass.method, remove_self=True).names == ("x",)
+        assert ParamProbe.cache.misses - misses == 2
+
+    def test_bound_methods_share_entry(self):
+        class Klass:
+            def method(self, x): ...
+
+        first, second = Klass(), Klass()
+        ParamProbe(first.method, remove_self=True)
+
+        hits = ParamProbe.cache.hits
+        assert ParamProbe(second.method, remove_self=True).names == ("x",)
+        assert ParamProbe(Klass.method, remove_self=True).names == ("x",)
+        assert ParamProbe.cache.hits - hits == 2
+
+        # `self` is added back per instance
+        probe = ParamProbe(second.method)
+        assert probe.names == ("self", "x")
+        assert probe["self"].default is second
+
+    def test_entries_are_weak(self):
+        cache = SignatureCache()
+
+        def func(a): ...
+
+        cache.get(func, False, lambda: "parsed")
+        assert len(cache) == 1
+
+        del func
+        gc.collect()
+        assert len(cache) == 0
+
+    def test_unreferenceable_keys(self):
+        cache = SignatureCache()
+        cache.get(object.__init__, False, lambda: "parsed")
+        assert cache.get(object.__init__, False, lambda: "reparsed") == "parsed"
+        assert cache.info() == {"hits": 1, "misses": 1, "size": 1}
+
+    def test_clear(self):
+        cache = SignatureCache()
+
+        def func(a): ...
+
+        cache.get(func, False, lambda: "parsed")
+        cache.clear()
+        assert cache.info() == {"hits": 0, "misses": 0, "size": 0}
+        assert cache.get(func, False, lambda: "reparsed") == "reparsed"
+
+
 class TestArgMutator:
     @pytest.fixture
     def mutator(self):
@@ -347,6 +450,17 @@ class TestArgMutator:
 
                 assert mutator_value == value
 
+    def test_lazy_construction(self, mutator):
+        lazy = ("sig", "bound_args", "_split_keys", "pos_sig", "kw_sig")
+        assert not any(name in vars(mutator) for name in lazy)
+
+        assert mutator["pos_only_param"] == {"pos_only_param": 1}
+        assert not any(name in vars(mutator) for name in lazy)
+
+        mutator.args = (10, 20)
+        assert "pos_sig" in vars(mutator) and "kw_sig" not in vars(mutator)
+        assert mutator.bound_args.arguments["pos_only_param"] == 1
+
     def test_values(self, mutator):
         assert mutator.values == (
             1,
@@ -416,6 +530,31 @@ class TestArgMutator:
             "another_kw": "another_kw_arg",
         }
 
+    def test_cached_views(self, mutator):
+        args, values = mutator.args, mutator.values
+        assert mutator.args is args and mutator.values is values
+
+        # Changing the returned kwargs doesn't change the mutator
+        mutator.kwargs["kw1"] = "changed"
+        assert mutator.kwargs["kw1"] == "kw1_arg"
+
+        mutator["pos_only_param"] = 100
+        mutator["kw1"] = "new_kw1_arg"
+        assert mutator.args == (100, 2, "a", "b", "c")
+        assert mutator.kwargs["kw1"] == "new_kw1_arg"
+        assert mutator.values[0] == 100
+
+    def test_call(self):
+        mutator = ArgMutator(add, 1, 2, c=3)
+        assert mutator.call() == 6
+
+        mutator["a"] = 10
+        mutator.kwargs = {"c": 30}
+        assert mutator.call() == 42
+
+        mutator = ArgMutator(SomeClass, 1, 2, 3)
+        assert isinstance(mutator.call(), SomeClass)
+
     def test_contains(self, mutator):
         assert "pos_only_param" in mutator
         assert "not_a_param" not in mutator
@@ -593,6 +732,69 @@ class TestArgMutator:
     def test_bind(self):
         assert ArgMutator.bind(some_func, 1, 2, 3) == {"a": 1, "b": 2, "c": 3}
 
+    @pytest.mark.parametrize(
+        "func, args, kwargs",
+        [
+            (some_func, (1, 2, 3), {}),
+            (some_func, (1,), {"c": 3, "b": 2}),
+            (some_func, (1, 2), {}),  # missing argument
+            (some_func, (1, 2, 3, 4), {}),  # too many arguments
+            (some_func, (1, 2, 3), {"a": 1}),  # multiple values
+            (many_params, (1, 2, 3, 4), {"kw_only_param": 5, "x": 6}),
+            (many_params, (1,), {"pos_or_kw_param": 2, "kw_only_param": 3}),
+            (many_params, (), {"pos_only_param": 1}),  # positional only by keyword
+            (with_a_default, (1, 2), {}),
+            (mixed_defaults, (1,), {"c": 3}),
+            (mixed_defaults, (1,), {"a": 0, "c": 3, "e": 5}),
+            (mixed_defaults, (1, 2, 3), {}),  # keyword only passed positionally
+            (SomeClass, (1, 2, 3), {}),
+            (SomeClass, (1, 2), {}),  # missing argument
+            (some_instance.many_params, (1, 2, 3), {"kw_only_param": 4}),
+        ],
+    )
+    def test_compiled_bind(self, monkeypatch, func, args, kwargs):
+        monkeypatch.setattr(ArgMutator, "compiled_bind", False)
+        try:
+            expected = ArgMutator.bind(func, *args, **kwargs)
+        except TypeError:
+            expected = TypeError
+
+        monkeypatch.setattr(ArgMutator, "compiled_bind", True)
+        if expected is TypeError:
+            # The binder's errors are the interpreter's, naming the function
+            # (by its qualified name on Python 3.10+)
+            name = "__init__" if isinstance(func, type) else func.__name__
+            with pytest.raises(TypeError, match=rf"^(\w+\.)?{name}\(\) "):
+                ArgMutator.bind(func, *args, **kwargs)
+        else:
+            result = ArgMutator.bind(func, *args, **kwargs)
+            assert result == expected
+            assert tuple(result) == tuple(expected)  # same order
+
+    def test_bind_many(self):
+        calls = [((1,), {"c": 3}), ((1, 2), {"c": 3, "d": 5, "e": 6})]
+        bound = ArgMutator.bind_many(mixed_defaults, iter(calls))
+        assert next(bound) == {"a": 1, "b": 2, "c": 3, "d": 4, "kwargs": {}}
+        assert list(bound) == [
+            {"a": 1, "b": 2, "c": 3, "d": 5, "kwargs": {"e": 6}},
+        ]
+
+        assert ArgMutator.bind_many(mixed_defaults, calls, columnar=True) == {
+            "a": [1, 1],
+            "b": [2, 2],
+            "c": [3, 3],
+            "d": [4, 5],
+            "kwargs": [{}, {"e": 6}],
+        }
+
+        with pytest.raises(TypeError):
+            list(ArgMutator.bind_many(some_func, [((1,), {})]))
+
+    def test_compile_binder(self):
+        binder = ArgMutator.compile_binder(mixed_defaults)
+        assert binder is ArgMutator.compile_binder(mixed_defaults)
+        assert binder(1, c=3) == {"a": 1, "b": 2, "c": 3, "d": 4, "kwargs": {}}
+
     def test_missing_args(self):
         assert ArgMutator.missing_args(some_func, 1, 2, 3) == ()
         assert ArgMutator.missing_args(some_func, 1, 2) == ("c",)
@@ -618,6 +820,23 @@ class TestArgMutator:
         assert ArgMutator.missing_args(with_a_default, 1) == ("b",)
         assert ArgMutator.missing_args(with_a_default, 1, 2) == ()
 
+        # Consecutive defaults, and extra keyword arguments
+        assert ArgMutator.missing_args(mixed_defaults) == ("a", "c")
+        assert ArgMutator.missing_args(mixed_defaults, 1, 2, 3, e=5) == ("c",)
+        # Positional only parameters can't be passed by keyword
+        assert ArgMutator.missing_args(mixed_defaults, a=1, c=3) == ("a",)
+
+    def test_missing_args_many(self):
+        calls = [((1, 2, 3), {}), ((1,), {"c": 3}), ((), {})]
+        assert ArgMutator.missing_args_many(some_func, calls) == (
+            (),
+            ("b",),
+            ("a", "b", "c"),
+        )
+        assert missing_args_many(some_func, calls) == ArgMutator.missing_args_many(
+            some_func, calls
+        )
+
 # bind_args and missing_args are tested directly, as they are used in the
 # ArgMutator class
 
@@ -687,6 +906,20 @@ def test_build_signature(
     assert bound_args == bind_result
 
 
+def test_build_signature_interned():
+    spec = {"pos_only": ("a",), "pos_or_kw": ["b"], "var_kw": "kwargs"}
+    signature = build_signature(**spec)
+    assert build_signature(**spec) is signature
+
+    for args, kwargs in [((1, 2), {}), ((1,), {"b": 2, "a": 3})]:
+        expected = dict(signature.bind(*args, **kwargs).arguments)
+        assert build_signature(**spec, bind_args=args, bind_kwargs=kwargs) == expected
+
+    for args in [(1,), (1, 2, 3)]:
+        with pytest.raises(TypeError):
+            build_signature(**spec, bind_args=args)
+
+
 def test_mapping_to_kwargs():
     mapping_one = {"a": 1, "b": 2, "c": 3, "d": 4}
     mapping_two = {"a": 1, "b": 2}
@@ -698,6 +931,36 @@ def test_mapping_to_kwargs():
     assert mapping_to_kwargs(SomeClass, mapping_two) == {"a": 1, "b": 2}
 
 
+
+class TestRecordLoader:
+    rows = [
+        {"x": 1, "y": 2, "label": "a", "extra": None},
+        {"x": 3},
+        {"x": 4, "label": "b", "extra": None, "other": None},
+    ]
+    expected = [Point(1, 2, label="a"), Point(3), Point(4, label="b")]
+
+    def test_load(self):
+        loader = RecordLoader(Point)
+        assert loader.names == ("x", "y", "label")
+        assert list(loader.load(iter(self.rows))) == self.expected
+        assert loader.load_one(self.rows[1]) == Point(3)
+        assert loader.dropped == {}
+
+    def test_dropped(self):
+        loader = RecordLoader(Point, track_dropped=True)
+        assert list(loader.load(self.rows)) == self.expected
+        assert loader.dropped == {"extra": 2, "other": 1}
+
+    def test_load_parallel(self):
+        loader = RecordLoader(Point, track_dropped=True)
+        rows = self.rows * 10
+
+        objects = list(loader.load(rows, processes=2, chunk_size=4))
+        assert objects == self.expected * 10
+        assert loader.dropped == {"extra": 20, "other": 10}
+
+
 if __name__ == "__main__":
     from pathlib import Path
     from pprint import pprint
@@ -0,0 +1,162 @@
+import pytest
+
+import asyncio
+import io
+import json
+import threading
+
+from misc_utils import (
+    timed,
+    LatencyHistogram,
+    get_histogram,
+    dump_histograms,
+    reset_histograms,
+)
+from misc_utils.timing_utils import BUCKETS, _bucket_index, _bucket_bounds
+
+
+@pytest.mark.parametrize("ns", [0, 1, 7, 8, 9, 1000, 123_456_789, 2**63 - 1])
+def test_buckets(ns):
+    index = _bucket_index(ns)
+    lowest, highest = _bucket_bounds(index)
+    assert 0 <= index < BUCKETS
+    assert lowest <= ns <= highest
+    assert highest - lowest <= max(lowest // 8, 0)
+
+
+def test_histogram():
+    histogram = LatencyHistogram("test")
+    assert histogram.summary() == {
+        "count": 0, "total_ns": 0, "p50_ns": 0, "p90_ns": 0, "p99_ns": 0, "max_ns": 0
+    }
+
+    for ns in range(1, 1001):
+        histogram.record(ns)
+
+    summary = histogram.summary()
+    assert (summary["count"], summary["total_ns"], summary["max_ns"]) == (1000, 500500, 1000)
+    for percent in (50, 90, 99):
+        assert summary[f"p{percent}_ns"] == pytest.approx(percent * 10, rel=1 / 8)
+    assert histogram.percentile(100) == 1000
+
+    with pytest.raises(ValueError):
+        histogram.percentile(101)
+
+    histogram.reset()
+    assert histogram.count == 0
+
+
+def test_histogram_threads():
+    histogram = LatencyHistogram("threads")
+
+    def record():
+        for ns in range(1000):
+            histogram.record(ns)
+
+    threads = [threading.Thread(target=record) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert histogram.count == 4000
+    assert histogram.max == 999
+
+    # The shards of threads that ended are merged into the retired shard
+    for _ in range(100):
+        thread = threading.Thread(target=histogram.record, args=(5,))
+        thread.start()
+        thread.join()
+    assert len(histogram._shards) == 1
+    assert histogram.count == 4100
+
+
+def test_timed():
+    reset_histograms()
+
+    @timed
+    def bare():
+        return 1
+
+    @timed("tests.named")
+    async def named():
+        return 2
+
+    assert bare() == 1 and bare() == 1
+    assert asyncio.run(named()) == 2
+    with timed("tests.block"):
+        pass
+
+    assert bare.histogram is get_histogram(f"{__name__}.test_timed.<locals>.bare")
+    assert bare.histogram.count == 2
+    assert get_histogram("tests.named").count == 1
+    assert get_histogram("tests.block").count == 1
+
+    with pytest.raises(TypeError):
+        with timed():
+            pass
+
+
+def test_timed_nested():
+    reset_histograms()
+    timer = timed("tests.nested")
+    assert timed("tests.nested").histogram is timer.histogram
+
+    with timer:
+        with timer:
+            pass
+    assert timer.histogram.count == 2
+    assert timer.histogram.max >= timer.histogram.percentile(0)
+
+
+def test_timed_interleaved():
+    reset_histograms()
+
+    async def block(start, stop):
+        await asyncio.sleep(start)
+        with timed("tests.interleaved"):
+            await asyncio.sleep(stop - start)
+
+    async def main():
+        # The second block enters after the first, and exits after it too
+        await asyncio.gather(block(0.0, 0.2), block(0.1, 0.4))
+
+    asyncio.run(main())
+    histogram = get_histogram("tests.interleaved")
+    assert histogram.count == 2
+    # 0.2s and 0.3s, not the 0.1s and 0.4s of swapped starts
+    assert 150_000_000 < histogram.percentile(50) < 250_000_000
+    assert 250_000_000 < histogram.max < 350_000_000
+
+
+def test_timed_disabled():
+    @timed("tests.disabled")
+    def func():
+        pass
+
+    timed.enabled = False
+    try:
+        func()
+        with timed("tests.disabled"):
+            pass
+    finally:
+        timed.enabled = True
+
+    assert get_histogram("tests.disabled").count == 0
+
+
+def test_dump_histograms(tmp_path):
+    reset_histograms()
+    with timed("tests.dump"):
+        pass
+
+    dump = json.loads(dump_histograms())
+    assert dump["tests.dump"]["count"] == 1
+    assert set(dump["tests.dump"]) == {
+        "count", "total_ns", "p50_ns", "p90_ns", "p99_ns", "max_ns"
+    }
+
+    file = io.StringIO()
+    path = tmp_path / "histograms.json"
+    assert dump_histograms(file) == file.getvalue() == dump_histograms(str(path))
+    assert json.loads(path.read_text()) == dump